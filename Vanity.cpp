@@ -108,6 +108,19 @@ static void TaggedHash(const char* tag, const uint8_t* data, size_t dataLen, uin
 
 // ----------------------------------------------------------------------------
 
+bool abortThrows = false;
+
+void abortSearch(int code) {
+
+  fflush(stdout);
+  if (abortThrows)
+    throw SearchAbort{ code };
+  exit(code);
+
+}
+
+// ----------------------------------------------------------------------------
+
 VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,string seed,int searchMode,
                            bool useGpu, bool stop, string outputFile, bool useSSE, uint32_t maxFound,
                            uint64_t rekey, bool caseSensitive, Point &startPubKey, bool paranoiacSeed,
@@ -115,13 +128,14 @@ VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,s
                            bool sigModeIn, bool schnorrModeIn, Int *sigMsgHashPtr, Int *sigPrivKeyPtr,
                            Int *sigPubKeyXPtr,
                            bool txidModeIn, std::vector<uint8_t> rawTxIn, int nonceOffsetIn, int nonceLenIn,
-                           bool taprootModeIn)
+                           bool taprootModeIn, bool machineOutputIn)
   :inputPrefixes(inputPrefixes) {
 
   // Initialize mutex handle to NULL (will be created in Search())
 #ifdef WIN64
   this->ghMutex = NULL;
 #endif
+  this->patternFound = NULL;
 
   this->secp = secp;
   this->searchMode = searchMode;
@@ -174,6 +188,8 @@ VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,s
   this->nonceOffset = nonceOffsetIn;
   this->nonceLen = nonceLenIn;
 
+  this->machineOutput = machineOutputIn;
+
   lastRekey = 0;
   prefixes.clear();
 
@@ -318,12 +334,12 @@ VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,s
 
     if (!caseSensitive && searchType == BECH32) {
       printf("Error, case unsensitive search with BECH32 not allowed.\n");
-      exit(1);
+      abortSearch(1);
     }
 
     if (nbPrefix == 0) {
       printf("VanitySearch: nothing to search !\n");
-      exit(1);
+      abortSearch(1);
     }
 
     // Second level lookup
@@ -389,7 +405,7 @@ VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,s
 
     default:
       printf("Invalid start character 1,3 or b, expected");
-      exit(1);
+      abortSearch(1);
 
     }
 
@@ -462,6 +478,17 @@ VanitySearch::VanitySearch(Secp256K1 *secp, vector<std::string> &inputPrefixes,s
 
 // ----------------------------------------------------------------------------
 
+VanitySearch::~VanitySearch() {
+
+  // Server mode builds one VanitySearch per job
+  for (int i = 0; i < (int)prefixes.size(); i++)
+    delete prefixes[i].items;
+  free(patternFound);
+
+}
+
+// ----------------------------------------------------------------------------
+
 bool VanitySearch::isSingularPrefix(std::string pref) {
 
   // check is the given prefix contains only 1
@@ -853,6 +880,7 @@ void VanitySearch::output(string addr,string pAddr,string pAddrHex) {
       break;
     }
     fprintf(f, "Priv (HEX): 0x%s\n", pAddrHex.c_str());
+    lastPrivHex = pAddrHex;
 
   }
 
@@ -2311,6 +2339,12 @@ void VanitySearch::Search(int nbThread,std::vector<int> gpuId,std::vector<int> g
   ghMutex = PTHREAD_MUTEX_INITIALIZER;
 #endif
 
+#ifdef WIN64
+  HANDLE *threads = new HANDLE[nbCPUThread + nbGPUThread];
+#else
+  pthread_t *threads = new pthread_t[nbCPUThread + nbGPUThread];
+#endif
+
   // Launch CPU threads
   for (int i = 0; i < nbCPUThread; i++) {
     params[i].obj = this;
@@ -2319,10 +2353,9 @@ void VanitySearch::Search(int nbThread,std::vector<int> gpuId,std::vector<int> g
 
 #ifdef WIN64
     DWORD thread_id;
-    CreateThread(NULL, 0, _FindKey, (void*)(params+i), 0, &thread_id);
+    threads[i] = CreateThread(NULL, 0, _FindKey, (void*)(params+i), 0, &thread_id);
 #else
-    pthread_t thread_id;
-    pthread_create(&thread_id, NULL, &_FindKey, (void*)(params+i));
+    pthread_create(&threads[i], NULL, &_FindKey, (void*)(params+i));
 #endif
   }
 
@@ -2336,10 +2369,9 @@ void VanitySearch::Search(int nbThread,std::vector<int> gpuId,std::vector<int> g
     params[nbCPUThread+i].gridSizeY = gridSize[2*i+1];
 #ifdef WIN64
     DWORD thread_id;
-    CreateThread(NULL, 0, _FindKeyGPU, (void*)(params+(nbCPUThread+i)), 0, &thread_id);
+    threads[nbCPUThread+i] = CreateThread(NULL, 0, _FindKeyGPU, (void*)(params+(nbCPUThread+i)), 0, &thread_id);
 #else
-    pthread_t thread_id;
-    pthread_create(&thread_id, NULL, &_FindKeyGPU, (void*)(params+(nbCPUThread+i)));
+    pthread_create(&threads[nbCPUThread+i], NULL, &_FindKeyGPU, (void*)(params+(nbCPUThread+i)));
 #endif
   }
 
@@ -2420,7 +2452,40 @@ void VanitySearch::Search(int nbThread,std::vector<int> gpuId,std::vector<int> g
 
   }
 
+  // isAlive() drops as soon as one worker stops; stop the rest and wait for
+  // all of them, so none outlives params (or a GPU thread its GPUEngine)
+  // when the server runs the next job
+  endOfSearch = true;
+  for (int i = 0; i < nbCPUThread + nbGPUThread; i++) {
+#ifdef WIN64
+    WaitForSingleObject(threads[i], INFINITE);
+    CloseHandle(threads[i]);
+#else
+    pthread_join(threads[i], NULL);
+#endif
+  }
+  delete[] threads;
+
+  if (machineOutput) {
+    // Whole-run rate from the final counters: the smoothed status rate only
+    // exists after the first 2 s tick, so a fast find would report 0. Below
+    // half a second start-up skew dominates, so the rate is left at 0 (the
+    // harness then falls back to the header estimate)
+    double elapsed = Timer::get_tick() - startTime;
+    uint64_t keys = (nbGPUThread > 0) ? getGPUCount() : getCPUCount();
+    printf("\n@@RESULT {\"throughput_mkeys\":%.2f,\"keys\":%llu,\"elapsed_sec\":%.3f,"
+      "\"private_key\":%s%s%s,\"found\":%s}\n",
+      (elapsed >= 0.5) ? (double)keys / elapsed / 1000000.0 : 0.0,
+      (unsigned long long)keys, elapsed,
+      lastPrivHex.empty() ? "" : "\"", lastPrivHex.empty() ? "null" : lastPrivHex.c_str(),
+      lastPrivHex.empty() ? "" : "\"", (nbFoundKey > 0) ? "true" : "false");
+  }
+
   free(params);
+#ifdef WIN64
+  CloseHandle(ghMutex);
+  ghMutex = NULL;
+#endif
 
 }
 
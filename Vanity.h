@@ -29,6 +29,14 @@
 
 #define CPU_GRP_SIZE 1024
 
+// Argument/setup errors call abortSearch() instead of exit(). In server mode
+// (--server) it throws SearchAbort so a bad job line only ends that job.
+struct SearchAbort {
+  int code;
+};
+extern bool abortThrows;
+void abortSearch(int code);
+
 class VanitySearch;
 
 typedef struct {
@@ -78,7 +86,8 @@ public:
                Int *sigPubKeyX = NULL,
                bool txidMode = false, std::vector<uint8_t> rawTx = std::vector<uint8_t>(),
                int nonceOffset = 0, int nonceLen = 4,
-               bool taprootMode = false);
+               bool taprootMode = false, bool machineOutput = false);
+  ~VanitySearch();
 
   void Search(int nbThread,std::vector<int> gpuId,std::vector<int> gridSize);
   void FindKeyCPU(TH_PARAM *p);
@@ -164,6 +173,10 @@ private:
   int nonceOffset;
   int nonceLen;
 
+  // Machine-readable summary (@@RESULT line on exit)
+  bool machineOutput;
+  std::string lastPrivHex;
+
   Int beta;
   Int lambda;
   Int beta2;
@@ -28,10 +28,11 @@ new_text = '''  } else if (sigMode) {
     printf("TXID mode: Matching %d bits of transaction ID\\n", stegoTarget.numBits);
   } else if (!hasPattern) {'''
 
-if old_text in content:
-    content = content.replace(old_text, new_text)
+# Single scan: an unchanged result means the anchor was not found
+patched = content.replace(old_text, new_text, 1)
+if patched != content:
     with open('Vanity.cpp', 'w') as f:
-        f.write(content)
+        f.write(patched)
     print("Successfully added sigMode initialization!")
 else:
     print("ERROR: Could not find the target text to replace")
@@ -20,6 +20,8 @@
 #include "SECP256k1.h"
 #include "StegoTarget.h"
 #include <fstream>
+#include <iostream>
+#include <sstream>
 #include <string>
 #include <string.h>
 #include <stdexcept>
@@ -67,6 +69,8 @@ void printUsage() {
   printf(" -rp privkey partialkeyfile: Reconstruct final private key(s) from partial key(s) info.\n");
   printf(" -sp startPubKey: Start the search with a pubKey (for private key splitting)\n");
   printf(" -r rekey: Rekey interval in MegaKey, default is disabled\n");
+  printf(" --machine-output: Print a final @@RESULT {json} summary line (for test harnesses)\n");
+  printf(" --server: Read one set of search arguments per stdin line, keeping the GPU context between jobs\n");
   printf("\nPubkey mask mode:\n");
   printf(" -mask: Enable pubkey coordinate masking (match raw X coordinate)\n");
   printf(" -tx <hex>: Target value for X coordinate (hex, up to 64 chars)\n");
@@ -92,7 +96,7 @@ void printUsage() {
   printf(" --prefix <n>: Match first N bytes of TXID\n");
   printf(" -nonce-offset <n>: Byte offset of nonce in tx (default: last 4 bytes)\n");
   printf(" -nonce-len <n>: Number of nonce bytes to grind (1-8, default: 4)\n");
-  exit(0);
+  abortSearch(0);
 
 }
 
@@ -109,7 +113,7 @@ int getInt(string name,char *v) {
   } catch(std::invalid_argument&) {
 
     printf("Invalid %s argument, number expected\n",name.c_str());
-    exit(-1);
+    abortSearch(-1);
 
   }
 
@@ -139,7 +143,7 @@ void getInts(string name,vector<int> &tokens, const string &text, char sep) {
   } catch(std::invalid_argument &) {
 
     printf("Invalid %s argument, number expected\n",name.c_str());
-    exit(-1);
+    abortSearch(-1);
 
   }
 
@@ -153,7 +157,7 @@ void parseFile(string fileName, vector<string> &lines) {
   FILE *fp = fopen(fileName.c_str(), "rb");
   if (fp == NULL) {
     printf("Error: Cannot open %s %s\n", fileName.c_str(), strerror(errno));
-    exit(-1);
+    abortSearch(-1);
   }
   fseek(fp, 0L, SEEK_END);
   size_t sz = ftell(fp);
@@ -198,7 +202,7 @@ void generateKeyPair(Secp256K1 *secp, string seed, int searchMode,bool paranoiac
   if (seed.length() < 8) {
     printf("Error: Use a seed of at least 8 characters to generate a key pair\n");
     printf("Ex: VanitySearch -s \"A Strong Password\" -kp\n");
-    exit(-1);
+    abortSearch(-1);
   }
 
   if(paranoiacSeed)
@@ -206,7 +210,7 @@ void generateKeyPair(Secp256K1 *secp, string seed, int searchMode,bool paranoiac
 
   if (searchMode == SEARCH_BOTH) {
     printf("Error: Use compressed or uncompressed to generate a key pair\n");
-    exit(-1);
+    abortSearch(-1);
   }
 
   bool compressed = (searchMode == SEARCH_COMPRESSED);
@@ -287,7 +291,7 @@ void reconstructAdd(Secp256K1 *secp, string fileName, string outputFile, string
 
   Int privKey = secp->DecodePrivateKey((char *)privAddr.c_str(),&compressed);
   if(privKey.IsNegative())
-    exit(-1);
+    abortSearch(-1);
 
   vector<string> lines;
   parseFile(fileName,lines);
@@ -317,21 +321,21 @@ void reconstructAdd(Secp256K1 *secp, string fileName, string outputFile, string
 
     } else {
       printf("Invalid partialkey info file at line %d (\"PubAddress: \" expected)\n",i);
-      exit(-1);
+      abortSearch(-1);
     }
 
     if (lines[i+1].substr(0, 13) == "PartialPriv: ") {
       partialPrivAddr = lines[i+1].substr(13);
     } else {
       printf("Invalid partialkey info file at line %d (\"PartialPriv: \" expected)\n", i);
-      exit(-1);
+      abortSearch(-1);
     }
 
     bool partialMode;
     Int partialPrivKey = secp->DecodePrivateKey((char *)partialPrivAddr.c_str(), &partialMode);
     if (privKey.IsNegative()) {
       printf("Invalid partialkey info file at line %d\n", i);
-      exit(-1);
+      abortSearch(-1);
     }
 
     if (partialMode != compressed) {
@@ -395,20 +399,12 @@ void reconstructAdd(Secp256K1 *secp, string fileName, string outputFile, string
 
 // ------------------------------------------------------------------------------------------
 
-int main(int argc, char* argv[]) {
-
-  // Global Init
-  Timer::Init();
-  rseed(Timer::getSeed32());
-
-  // Init SecpK1
-  Secp256K1 *secp = new Secp256K1();
-  secp->Init();
+int runSearch(Secp256K1 *secp, int argc, char* argv[]) {
 
   // Browse arguments
   if (argc < 2) {
     printf("Error: No arguments (use -h for help)\n");
-    exit(-1);
+    abortSearch(-1);
   }
 
   int a = 1;
@@ -430,6 +426,7 @@ int main(int argc, char* argv[]) {
   bool startPubKeyCompressed;
   bool caseSensitive = true;
   bool paranoiacSeed = false;
+  bool machineOutput = false;
   
   // Steganography mode variables
   bool stegoMode = false;
@@ -467,12 +464,15 @@ int main(int argc, char* argv[]) {
     } else if (strcmp(argv[a], "-stop") == 0) {
       stop = true;
       a++;
+    } else if (strcmp(argv[a], "--machine-output") == 0) {
+      machineOutput = true;
+      a++;
     } else if (strcmp(argv[a], "-c") == 0) {
       caseSensitive = false;
       a++;
     } else if (strcmp(argv[a], "-v") == 0) {
       printf("%s\n",RELEASE);
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-check") == 0) {
 
       Int::Check();
@@ -489,7 +489,7 @@ int main(int argc, char* argv[]) {
 #else
   printf("GPU code not compiled, use -DWITHGPU when compiling.\n");
 #endif
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-l") == 0) {
 
 #ifdef WITHGPU
@@ -497,11 +497,11 @@ int main(int argc, char* argv[]) {
 #else
   printf("GPU code not compiled, use -DWITHGPU when compiling.\n");
 #endif
-      exit(0);
+      abortSearch(0);
 
     } else if (strcmp(argv[a], "-kp") == 0) {
       generateKeyPair(secp,seed,searchMode,paranoiacSeed);
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-sp") == 0) {
       a++;
       string pub = string(argv[a]);
@@ -515,7 +515,7 @@ int main(int argc, char* argv[]) {
       printf("Addr (P2PKH): %s\n",secp->GetAddress(P2PKH,isComp,p).c_str());
       printf("Addr (P2SH): %s\n",secp->GetAddress(P2SH,isComp,p).c_str());
       printf("Addr (BECH32): %s\n",secp->GetAddress(BECH32,isComp,p).c_str());
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-cp") == 0) {
       a++;
       string priv = string(argv[a]);
@@ -532,7 +532,7 @@ int main(int argc, char* argv[]) {
       printf("Addr (P2PKH): %s\n", secp->GetAddress(P2PKH,isComp,p).c_str());
       printf("Addr (P2SH): %s\n", secp->GetAddress(P2SH,isComp,p).c_str());
       printf("Addr (BECH32): %s\n", secp->GetAddress(BECH32,isComp,p).c_str());
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-rp") == 0) {
       a++;
       string priv = string(argv[a]);
@@ -540,7 +540,7 @@ int main(int argc, char* argv[]) {
       string file = string(argv[a]);
       a++;
       reconstructAdd(secp,file,outputFile,priv);
-      exit(0);
+      abortSearch(0);
     } else if (strcmp(argv[a], "-u") == 0) {
       searchMode = SEARCH_UNCOMPRESSED;
       a++;
@@ -645,7 +645,7 @@ int main(int argc, char* argv[]) {
       a++;
     } else {
       printf("Unexpected %s argument\n",argv[a]);
-      exit(-1);
+      abortSearch(-1);
     }
 
   }
@@ -659,7 +659,7 @@ int main(int argc, char* argv[]) {
     }
   } else if(gridSize.size() != gpuId.size()*2) {
     printf("Invalid gridSize or gpuId argument, must have coherent size\n");
-    exit(-1);
+    abortSearch(-1);
   }
 
   // Let one CPU core free per gpu is gpu is enabled
@@ -678,14 +678,14 @@ int main(int argc, char* argv[]) {
   if (stegoMode) {
     if (stegoTargetHex.empty()) {
       printf("Error: Mask mode requires -tx <target_hex>\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse target value (MSB-aligned to match prefix mask)
     int bytes = parseHexToLimbsMSB(stegoTargetHex.c_str(), stegoTarget.value);
     if (bytes < 0) {
       printf("Error: Invalid hex in -tx\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Generate or parse mask
@@ -727,22 +727,22 @@ int main(int argc, char* argv[]) {
   if (sigMode) {
     if (stegoTargetHex.empty()) {
       printf("Error: Signature mode requires -tx <target_hex> for R.x value\n");
-      exit(-1);
+      abortSearch(-1);
     }
     if (sigMsgHashHex.empty()) {
       printf("Error: Signature mode requires -z <msghash> (32-byte message hash)\n");
-      exit(-1);
+      abortSearch(-1);
     }
     if (sigPrivKeyHex.empty()) {
       printf("Error: Signature mode requires -d <privkey> (signing private key)\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse target R.x value (MSB-aligned to match prefix mask)
     int bytes = parseHexToLimbsMSB(stegoTargetHex.c_str(), stegoTarget.value);
     if (bytes < 0) {
       printf("Error: Invalid hex in -tx\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Generate or parse mask
@@ -759,14 +759,14 @@ int main(int argc, char* argv[]) {
     sigMsgHash.SetBase16((char *)sigMsgHashHex.c_str());
     if (sigMsgHash.IsZero() && sigMsgHashHex.length() > 0) {
       printf("Error: Invalid message hash in -z\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse signing private key
     sigPrivKey.SetBase16((char *)sigPrivKeyHex.c_str());
     if (sigPrivKey.IsZero()) {
       printf("Error: Invalid private key in -d\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse signing pubkey X for Schnorr (required for challenge hash)
@@ -779,7 +779,7 @@ int main(int argc, char* argv[]) {
         sigPubKeyX.SetBase16((char *)sigPubKeyHex.c_str());
         if (sigPubKeyX.IsZero() && sigPubKeyHex.length() > 0) {
           printf("Error: Invalid pubkey X in -p\n");
-          exit(-1);
+          abortSearch(-1);
         }
       }
     }
@@ -811,11 +811,11 @@ int main(int argc, char* argv[]) {
   if (txidMode) {
     if (rawTxHex.empty()) {
       printf("Error: TXID mode requires -raw <tx_hex>\n");
-      exit(-1);
+      abortSearch(-1);
     }
     if (stegoTargetHex.empty()) {
       printf("Error: TXID mode requires -tx <target_hex> for TXID pattern\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse raw transaction hex
@@ -824,11 +824,11 @@ int main(int argc, char* argv[]) {
     int txLen = parseHexToBytes(rawTxHex.c_str(), rawTxBytes.data(), maxTxLen);
     if (txLen < 0) {
       printf("Error: Invalid hex in -raw (must be even length)\n");
-      exit(-1);
+      abortSearch(-1);
     }
     if (txLen < 10) {
       printf("Error: Transaction too short (%d bytes)\n", txLen);
-      exit(-1);
+      abortSearch(-1);
     }
     rawTxBytes.resize(txLen);
 
@@ -841,18 +841,18 @@ int main(int argc, char* argv[]) {
     if (nonceOffset < 0 || nonceOffset + nonceLen > txLen) {
       printf("Error: Nonce position out of bounds (offset=%d, len=%d, txLen=%d)\n",
              nonceOffset, nonceLen, txLen);
-      exit(-1);
+      abortSearch(-1);
     }
     if (nonceLen < 1 || nonceLen > 8) {
       printf("Error: Nonce length must be 1-8 bytes\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse target TXID pattern (display byte order for TXID)
     int bytes = parseHexAsDisplayBytes(stegoTargetHex.c_str(), stegoTarget.value);
     if (bytes < 0) {
       printf("Error: Invalid hex in -tx (must be even length)\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Generate or parse mask (display order for TXID)
@@ -899,14 +899,14 @@ int main(int argc, char* argv[]) {
   if (taprootMode) {
     if (stegoTargetHex.empty()) {
       printf("Error: Taproot mode requires -tx <target_hex> for output key prefix\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Parse target Q.x value (post-tweak output key)
     int bytes = parseHexToLimbsMSB(stegoTargetHex.c_str(), stegoTarget.value);
     if (bytes < 0) {
       printf("Error: Invalid hex in -tx\n");
-      exit(-1);
+      abortSearch(-1);
     }
 
     // Generate or parse mask
@@ -939,8 +939,65 @@ int main(int argc, char* argv[]) {
     sigMode, schnorrMode, sigMode ? &sigMsgHash : NULL, sigMode ? &sigPrivKey : NULL,
     (sigMode && schnorrMode) ? &sigPubKeyX : NULL,
     txidMode, rawTxBytes, nonceOffset, nonceLen,
-    taprootMode);
+    taprootMode, machineOutput);
   v->Search(nbCPUThread,gpuId,gridSize);
+  delete v;
+
+  return 0;
+}
+
+// ------------------------------------------------------------------------------------------
+
+// Server mode: each stdin line holds the arguments of one search. The process
+// (and so its CUDA context and loaded kernels) stays alive between jobs; each
+// job's output is terminated by an "@@DONE" line.
+int serverLoop(Secp256K1 *secp) {
+
+  abortThrows = true;
+
+  string line;
+  while (getline(cin, line)) {
+
+    vector<string> tokens;
+    istringstream iss(line);
+    string token;
+    while (iss >> token)
+      tokens.push_back(token);
+    if (tokens.empty())
+      continue;
+
+    vector<char *> args;
+    args.push_back((char *)"VanitySearch");
+    for (int i = 0; i < (int)tokens.size(); i++)
+      args.push_back((char *)tokens[i].c_str());
+
+    try {
+      runSearch(secp, (int)args.size(), args.data());
+    } catch (SearchAbort &) {
+      // Usage or argument error: the message is already printed, keep serving
+    }
+    printf("\n@@DONE\n");
+    fflush(stdout);
+
+  }
 
   return 0;
 }
+
+// ------------------------------------------------------------------------------------------
+
+int main(int argc, char* argv[]) {
+
+  // Global Init
+  Timer::Init();
+  rseed(Timer::getSeed32());
+
+  // Init SecpK1
+  Secp256K1 *secp = new Secp256K1();
+  secp->Init();
+
+  if (argc == 2 && strcmp(argv[1], "--server") == 0)
+    return serverLoop(secp);
+
+  return runSearch(secp, argc, argv);
+}
@@ -23,6 +23,7 @@ import time
 import hashlib
 import tempfile
 import argparse
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -30,13 +31,32 @@ from dataclasses import dataclass, asdict
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Key derivation: coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PublicKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
 try:
     from ecdsa import SECP256k1, SigningKey
     ECDSA_AVAILABLE = True
 except ImportError:
-    print("ERROR: ecdsa library required. Install with: pip install ecdsa")
     ECDSA_AVAILABLE = False
 
+EC_AVAILABLE = COINCURVE_AVAILABLE or ECDSA_AVAILABLE
+if not EC_AVAILABLE:
+    print("ERROR: coincurve or ecdsa library required. Install with: pip install coincurve")
+
+# Optional: C-accelerated base58 (pip install base58)
+try:
+    import base58
+    BASE58_AVAILABLE = True
+except ImportError:
+    BASE58_AVAILABLE = False
+
+BASE58_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
 # Configuration
 VANITYSEARCH_EXE = Path(__file__).parent.parent / "x64" / "Release" / "VanitySearch.exe"
 BITCOIN_CLI = "bitcoin-cli"
@@ -45,6 +65,11 @@ RPC_USER = "test"
 RPC_PASS = "test"
 REGTEST_ARGS = ["-regtest", f"-rpcuser={RPC_USER}", f"-rpcpassword={RPC_PASS}"]
 
+# VanitySearch output is kept as bytes; only matched groups are decoded
+PRIV_RE = re.compile(rb'Priv \(HEX\):\s*0x([0-9A-Fa-f]+)')
+SIG_R_RE = re.compile(rb'sig\.r:\s*([0-9A-Fa-f]+)')
+SIG_S_RE = re.compile(rb'sig\.s:\s*([0-9A-Fa-f]+)')
+
 
 @dataclass
 class IntegrationTestResult:
@@ -81,33 +106,37 @@ def run_bitcoin_cli(args: List[str], timeout: float = 30) -> Dict:
 
 
 def run_vanitysearch(args: List[str], timeout: float = 120) -> Dict:
-    """Run VanitySearch command."""
+    """Run VanitySearch command. 'output' is the raw stdout bytes."""
     if not VANITYSEARCH_EXE.exists():
-        return {'success': False, 'output': '', 'error': f'VanitySearch not found at {VANITYSEARCH_EXE}'}
+        return {'success': False, 'output': b'', 'error': f'VanitySearch not found at {VANITYSEARCH_EXE}'}
 
     cmd = [str(VANITYSEARCH_EXE)] + args
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
         return {
             'success': result.returncode == 0,
             'output': result.stdout,
-            'error': result.stderr,
+            'error': result.stderr.decode(errors='replace'),
             'returncode': result.returncode
         }
     except subprocess.TimeoutExpired:
-        return {'success': False, 'output': '', 'error': 'TIMEOUT'}
+        return {'success': False, 'output': b'', 'error': 'TIMEOUT'}
     except Exception as e:
-        return {'success': False, 'output': '', 'error': str(e)}
+        return {'success': False, 'output': b'', 'error': str(e)}
 
 
-def extract_privkey(output: str) -> Optional[str]:
+def extract_privkey(output: bytes) -> Optional[str]:
     """Extract private key from VanitySearch output."""
-    match = re.search(r'Priv \(HEX\):\s*0x([0-9A-Fa-f]+)', output)
+    match = PRIV_RE.search(output)
     if match:
-        return match.group(1).upper().zfill(64)
+        return match.group(1).decode('ascii').upper().zfill(64)
     return None
 
 
+# SHA256 states primed with the WIF version byte (0xef testnet/regtest, 0x80 mainnet)
+_WIF_PREFIX_SHA256 = {True: hashlib.sha256(b'\xef'), False: hashlib.sha256(b'\x80')}
+
+
 def privkey_to_wif(privkey_hex: str, testnet: bool = True) -> str:
     """Convert private key hex to WIF format for regtest."""
     prefix = b'\xef' if testnet else b'\x80'  # 0xef for testnet/regtest
@@ -116,8 +145,10 @@ def privkey_to_wif(privkey_hex: str, testnet: bool = True) -> str:
     # Add compression flag
     extended = prefix + privkey_bytes + b'\x01'
 
-    # Double SHA256 checksum
-    checksum = hashlib.sha256(hashlib.sha256(extended).digest()).digest()[:4]
+    # Double SHA256 checksum, resuming from the primed prefix state
+    h = _WIF_PREFIX_SHA256[testnet].copy()
+    h.update(extended[1:])
+    checksum = hashlib.sha256(h.digest()).digest()[:4]
 
     # Base58 encode
     return base58_encode(extended + checksum)
@@ -125,40 +156,41 @@ def privkey_to_wif(privkey_hex: str, testnet: bool = True) -> str:
 
 def base58_encode(data: bytes) -> str:
     """Base58 encode bytes."""
-    alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+    if BASE58_AVAILABLE:
+        return base58.b58encode(data).decode('ascii')
+
+    # Collect digits least-significant first, reverse once at the end
     num = int.from_bytes(data, 'big')
-    result = ''
+    buf = bytearray()
     while num > 0:
         num, remainder = divmod(num, 58)
-        result = alphabet[remainder] + result
+        buf.append(BASE58_ALPHABET[remainder])
 
     # Handle leading zeros
-    for byte in data:
-        if byte == 0:
-            result = '1' + result
-        else:
-            break
-
-    return result
+    buf.extend(b'1' * (len(data) - len(data.lstrip(b'\x00'))))
+    buf.reverse()
+    return buf.decode('ascii')
 
 
 def derive_pubkey_and_address(privkey_hex: str) -> Dict:
     """Derive compressed pubkey and P2WPKH address from private key."""
-    if not ECDSA_AVAILABLE:
-        return {'error': 'ecdsa library not available'}
+    if not EC_AVAILABLE:
+        return {'error': 'coincurve/ecdsa library not available'}
 
     try:
         d_bytes = bytes.fromhex(privkey_hex)
-        sk = SigningKey.from_string(d_bytes, curve=SECP256k1)
-        vk = sk.get_verifying_key()
-        pubkey = vk.to_string()
-
-        x = pubkey[:32]
-        y = pubkey[32:]
+        if COINCURVE_AVAILABLE:
+            compressed_pubkey = PublicKey.from_secret(d_bytes).format(compressed=True)
+            x = compressed_pubkey[1:]
+        else:
+            sk = SigningKey.from_string(d_bytes, curve=SECP256k1)
+            pubkey = sk.get_verifying_key().to_string()
+            x = pubkey[:32]
+            y = pubkey[32:]
 
-        # Compressed pubkey
-        prefix = b'\x02' if int.from_bytes(y, 'big') % 2 == 0 else b'\x03'
-        compressed_pubkey = prefix + x
+            # Compressed pubkey
+            prefix = b'\x02' if int.from_bytes(y, 'big') % 2 == 0 else b'\x03'
+            compressed_pubkey = prefix + x
 
         # P2WPKH address (bech32)
         # hash160 = RIPEMD160(SHA256(pubkey))
@@ -481,17 +513,18 @@ def test_signature_r_grinding() -> IntegrationTestResult:
         print("  Step 3: Extracting signature values...")
         output = grind_result['output']
 
-        r_match = re.search(r'sig\.r:\s*([0-9A-Fa-f]+)', output)
-        s_match = re.search(r'sig\.s:\s*([0-9A-Fa-f]+)', output)
+        r_match = SIG_R_RE.search(output)
+        s_match = SIG_S_RE.search(output)
 
         if r_match:
-            details['sig_r'] = r_match.group(1)[:16] + '...'
-            details['r_starts_with_target'] = r_match.group(1).upper().startswith(target)
+            sig_r = r_match.group(1).decode('ascii')
+            details['sig_r'] = sig_r[:16] + '...'
+            details['r_starts_with_target'] = sig_r.upper().startswith(target)
         else:
             details['r_starts_with_target'] = False
 
         if s_match:
-            details['sig_s'] = s_match.group(1)[:16] + '...'
+            details['sig_s'] = s_match.group(1)[:16].decode('ascii') + '...'
 
         steps_completed = 3
 
@@ -524,8 +557,8 @@ def run_all_tests(skip_startup: bool = False) -> List[IntegrationTestResult]:
         print(f"\nERROR: VanitySearch.exe not found at {VANITYSEARCH_EXE}")
         return results
 
-    if not ECDSA_AVAILABLE:
-        print("\nERROR: ecdsa library required")
+    if not EC_AVAILABLE:
+        print("\nERROR: coincurve or ecdsa library required")
         return results
 
     # Start bitcoind if needed
@@ -570,7 +603,7 @@ def print_summary(results: List[IntegrationTestResult]) -> None:
     print("INTEGRATION TEST SUMMARY")
     print("=" * 70)
 
-    passed = sum(1 for r in results if r.passed)
+    passed = sum(map(attrgetter('passed'), results))
     print(f"\nTotal: {len(results)}")
     print(f"Passed: {passed}")
     print(f"Failed: {len(results) - passed}")
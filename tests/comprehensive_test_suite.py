@@ -3,15 +3,16 @@
 VanityMask Comprehensive Test Suite
 
 A rigorous test framework for all VanityMask grinding modes with:
-- Cryptographic verification using Python ecdsa library
+- Cryptographic verification via coincurve (libsecp256k1), falling back to ecdsa
 - GPU utilization monitoring (target: 90-95% for EC, 60-65% for TXID)
 - Estimated duration tracking
-- JSON result output for CI/automation
+- JSON result output for CI/automation (per-result .partial.jsonl while running)
 
 Usage:
     python comprehensive_test_suite.py --quick     # Quick tests (<5 min)
     python comprehensive_test_suite.py --full      # Full tests (~90 min)
     python comprehensive_test_suite.py --benchmark # Performance benchmarks
+    python comprehensive_test_suite.py --quick --fast-verify  # Skip EC re-derivation
 """
 
 import subprocess
@@ -20,12 +21,16 @@ import os
 import re
 import json
 import time
-import random
 import hashlib
+import importlib.util
+import secrets
 import argparse
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, IO, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field, asdict
 
 # Add parent directory to path for imports
@@ -37,12 +42,41 @@ except ImportError:
     print("Warning: gpu_monitor.py not found, GPU monitoring disabled")
     GPUMonitor = None
 
+# Try to import orjson for faster result serialization
 try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# EC verification: coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PrivateKey as CCPrivateKey, PublicKey as CCPublicKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+# ecdsa is only needed without coincurve, so it is imported on first use
+ECDSA_AVAILABLE = importlib.util.find_spec('ecdsa') is not None
+
+
+@lru_cache(maxsize=None)
+def _ecdsa():
+    """Import the pure-Python ecdsa fallback on first use; returns (SECP256k1, SigningKey)."""
     from ecdsa import SECP256k1, SigningKey
-    ECDSA_AVAILABLE = True
+    return SECP256k1, SigningKey
+
+
+EC_AVAILABLE = COINCURVE_AVAILABLE or ECDSA_AVAILABLE
+if not EC_AVAILABLE:
+    print("Warning: coincurve or ecdsa library not found, install with: pip install coincurve")
+
+# Optional: GMP modular inverse (pip install gmpy2), pow(x, -1, N) otherwise
+try:
+    import gmpy2
+    GMPY2_AVAILABLE = True
 except ImportError:
-    print("Warning: ecdsa library not found, install with: pip install ecdsa")
-    ECDSA_AVAILABLE = False
+    GMPY2_AVAILABLE = False
 
 
 # Configuration
@@ -58,6 +92,27 @@ FIXED_Z = "0102030405060708090A0B0C0D0E0F101112131415161718191A1B1C1D1E1F20"
 FIXED_D = "0000000000000000000000000000000000000000000000000000000000000001"
 FIXED_P = "79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798"  # G.x
 
+# GPU sampling: short runs keep 0.5s resolution, long runs back off to 2s
+GPU_SAMPLE_INTERVAL_MIN = 0.5
+GPU_SAMPLE_INTERVAL_MAX = 2.0
+GPU_SAMPLES_PER_RUN = 20
+
+# Progress/status lines ("[8.50 GKey/s][GPU ...]") are dropped while streaming
+PROGRESS_LINE_PREFIX = '['
+
+# All result-line fields in one alternation, scanned with a single finditer
+# pass (privkey: "Priv (HEX): 0x..." or taproot "Private key (d): ...")
+RESULT_FIELDS_RE = re.compile(
+    r'(?:Priv \(HEX\):\s*0x|Private key \(d\):\s*)(?P<privkey>[0-9A-Fa-f]+)'
+    r'|MASK:(?P<pubkey_x>[0-9A-Fa-f]+)'
+    r'|Nonce \(k\):\s*(?P<sig_nonce>[0-9A-Fa-f]+)'
+    r'|sig\.r:\s*(?P<r>[0-9A-Fa-f]+)'
+    r'|sig\.s:\s*(?P<s>[0-9A-Fa-f]+)'
+    r'|Nonce:\s*0x(?P<txid_nonce>[0-9A-Fa-f]+)'
+    r'|TXID:\s*(?P<txid>[0-9A-Fa-f]+)',
+    re.ASCII
+)
+
 # Minimal valid transaction for TXID tests (59 bytes)
 MINIMAL_TX = "0100000001000000000000000000000000000000000000000000000000000000000000000000000000ffffffff0100000000000000000000000000"
 
@@ -91,15 +146,48 @@ class TestSuite:
     results: List[TestResult] = field(default_factory=list)
     gpu_info: Optional[Dict] = None
     summary: Optional[Dict] = None
+    # Per-mode [count, passed, verified, elapsed, gpu_util, gpu_met], kept by add_result
+    by_mode: Dict[str, List] = field(default_factory=dict)
+    # JSONL sidecar with one line per result, so an aborted run keeps its data
+    partial: Optional[IO] = field(default=None, repr=False)
+    partial_path: Optional[Path] = None
+
+    def open_partial(self, path: Path) -> None:
+        self.partial_path = path
+        self.partial = open(path, 'w')
+
+    def close_partial(self) -> None:
+        """Drop the sidecar once the full results file is written."""
+        if self.partial is not None:
+            self.partial.close()
+            self.partial_path.unlink(missing_ok=True)
+            self.partial = None
 
     def add_result(self, result: TestResult) -> None:
         self.results.append(result)
+        if self.partial is not None:
+            # Written at add time; pooled verification may still be pending
+            self.partial.write(json_line(result))
+            self.partial.flush()
+        totals = self.by_mode.setdefault(result.mode, [0, 0, 0, 0.0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += result.passed
+        totals[2] += result.verified
+        totals[3] += result.elapsed
+        totals[4] += result.gpu_util_avg
+        totals[5] += result.gpu_util_met
+
+    def count_late_verification(self, result: TestResult) -> None:
+        """Credit a result whose pooled verification passed after add_result."""
+        self.by_mode[result.mode][2] += 1
 
     def finalize(self) -> None:
         self.completed = datetime.now().isoformat()
-        passed = sum(1 for r in self.results if r.passed)
-        verified = sum(1 for r in self.results if r.verified)
-        gpu_met = sum(1 for r in self.results if r.gpu_util_met)
+        passed = verified = gpu_met = 0
+        for _, mode_passed, mode_verified, _, _, mode_gpu_met in self.by_mode.values():
+            passed += mode_passed
+            verified += mode_verified
+            gpu_met += mode_gpu_met
 
         self.summary = {
             'total': len(self.results),
@@ -111,23 +199,71 @@ class TestSuite:
         }
 
     def to_dict(self) -> Dict:
+        """Suite record for write_json; results stay TestResult and are serialized as written."""
         return {
             'name': self.name,
             'started': self.started,
             'completed': self.completed,
             'gpu_info': self.gpu_info,
             'summary': self.summary,
-            'results': [r.to_dict() for r in self.results]
+            'results': self.results
         }
 
 
+def write_json(path: Path, data) -> None:
+    """Write data (dataclasses included) as indented JSON, via orjson if installed."""
+    if ORJSON_AVAILABLE:  # orjson serializes dataclasses natively
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=lambda o: o.to_dict())
+
+
+def json_line(result: TestResult) -> str:
+    """One result as a single JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result).decode() + '\n'
+    return json.dumps(result.to_dict()) + '\n'
+
+
 def random_hex(num_chars: int) -> str:
     """Generate random hex string of given length."""
-    return ''.join(random.choices('0123456789ABCDEF', k=num_chars))
+    return secrets.token_hex((num_chars + 1) // 2)[:num_chars].upper()
+
+
+# --pin-affinity (Linux): the harness and its threads keep one core and each
+# VanitySearch run gets the remaining ones, leaving its GPU-feeding thread
+# a core of its own.
+_VANITY_CPUS: set = set()
+
+
+def pin_affinity() -> bool:
+    """Pin the harness to its first allowed core; later runs get the rest."""
+    global _VANITY_CPUS
+    if not hasattr(os, 'sched_setaffinity'):
+        return False
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        return False
+    _VANITY_CPUS = set(cpus[1:])
+    os.sched_setaffinity(0, {cpus[0]})
+    return True
+
+
+def _drain(stream, kept: List[str], keep_progress: bool = True) -> None:
+    """Read a text stream to EOF, keeping lines (optionally minus progress lines)."""
+    for line in stream:
+        if keep_progress or not line.startswith(PROGRESS_LINE_PREFIX):
+            kept.append(line)
+    stream.close()
 
 
 def run_vanitysearch(args: List[str], timeout: float = 300) -> Dict:
-    """Run VanitySearch with given arguments."""
+    """Run VanitySearch with given arguments.
+
+    stdout is streamed and progress lines are discarded as they arrive, so
+    memory stays proportional to the result lines rather than the run length.
+    """
     if not VANITYSEARCH_EXE.exists():
         return {
             'success': False,
@@ -141,40 +277,69 @@ def run_vanitysearch(args: List[str], timeout: float = 300) -> Dict:
     start = time.time()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        elapsed = time.time() - start
-        return {
-            'success': result.returncode == 0,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'elapsed': elapsed,
-            'returncode': result.returncode
-        }
-    except subprocess.TimeoutExpired:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, errors='replace')
+    except Exception as e:
         return {
             'success': False,
             'stdout': '',
-            'stderr': 'TIMEOUT',
-            'elapsed': timeout,
+            'stderr': str(e),
+            'elapsed': time.time() - start,
             'returncode': -1
         }
-    except Exception as e:
+
+    if _VANITY_CPUS:
+        try:
+            os.sched_setaffinity(proc.pid, _VANITY_CPUS)
+        except OSError:
+            pass  # Already exited
+
+    stdout_lines: List[str] = []
+    stderr_lines: List[str] = []
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, stdout_lines, False), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, stderr_lines), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()  # Readers are daemons; output is discarded on timeout
         return {
             'success': False,
             'stdout': '',
-            'stderr': str(e),
-            'elapsed': time.time() - start,
+            'stderr': 'TIMEOUT',
+            'elapsed': timeout,
             'returncode': -1
         }
 
+    for reader in readers:
+        reader.join()
+    return {
+        'success': returncode == 0,
+        'stdout': ''.join(stdout_lines),
+        'stderr': ''.join(stderr_lines),
+        'elapsed': time.time() - start,
+        'returncode': returncode
+    }
+
+
+def gpu_sample_interval(expected_time: float) -> float:
+    """Monitor interval giving ~GPU_SAMPLES_PER_RUN samples, clamped to the configured range."""
+    return min(GPU_SAMPLE_INTERVAL_MAX, max(GPU_SAMPLE_INTERVAL_MIN, expected_time / GPU_SAMPLES_PER_RUN))
 
-def run_vanitysearch_with_gpu(args: List[str], mode: str, timeout: float = 300) -> Tuple[Dict, Dict]:
+
+def run_vanitysearch_with_gpu(args: List[str], mode: str, timeout: float = 300,
+                              sample_interval: float = GPU_SAMPLE_INTERVAL_MIN) -> Tuple[Dict, Dict]:
     """Run VanitySearch with GPU monitoring."""
     if GPUMonitor is None:
         result = run_vanitysearch(args, timeout)
         return result, {'error': 'GPU monitoring not available'}
 
-    monitor = GPUMonitor(sample_interval=0.5)
+    monitor = GPUMonitor(sample_interval=sample_interval)
     monitor.start()
 
     result = run_vanitysearch(args, timeout)
@@ -197,50 +362,50 @@ def run_vanitysearch_with_gpu(args: List[str], mode: str, timeout: float = 300)
 # ============================================================================
 # OUTPUT EXTRACTION
 # ============================================================================
+# Extracted hex values are uppercase; test_* functions uppercase their target
+# once on entry, so comparisons between the two need no further .upper().
+
+def extract_all(output: str) -> Dict[str, str]:
+    """Extract every result field (first occurrence of each, uppercased) in one pass."""
+    fields = {}
+    for match in RESULT_FIELDS_RE.finditer(output):
+        name = match.lastgroup
+        if name not in fields:
+            fields[name] = match.group(name).upper()
+    return fields
+
 
 def extract_privkey(output: str) -> Optional[str]:
     """Extract private key from VanitySearch output."""
-    match = re.search(r'Priv \(HEX\):\s*0x([0-9A-Fa-f]+)', output)
-    if match:
-        return match.group(1).upper().zfill(64)
-    match = re.search(r'Private key \(d\):\s*([0-9A-Fa-f]+)', output)
-    if match:
-        return match.group(1).upper().zfill(64)
-    return None
+    privkey = extract_all(output).get('privkey')
+    return privkey.zfill(64) if privkey else None
 
 
 def extract_pubkey_x(output: str) -> Optional[str]:
     """Extract pubkey X from mask mode output."""
-    match = re.search(r'MASK:([0-9A-Fa-f]+)', output)
-    if match:
-        return match.group(1).upper()
-    return None
+    return extract_all(output).get('pubkey_x')
 
 
 def extract_sig_values(output: str) -> Dict:
     """Extract signature values from sig mode output."""
+    fields = extract_all(output)
     result = {}
-    nonce_match = re.search(r'Nonce \(k\):\s*([0-9A-Fa-f]+)', output)
-    if nonce_match:
-        result['nonce'] = nonce_match.group(1).upper()
-    r_match = re.search(r'sig\.r:\s*([0-9A-Fa-f]+)', output)
-    if r_match:
-        result['r'] = r_match.group(1).upper()
-    s_match = re.search(r'sig\.s:\s*([0-9A-Fa-f]+)', output)
-    if s_match:
-        result['s'] = s_match.group(1).upper()
+    if 'sig_nonce' in fields:
+        result['nonce'] = fields['sig_nonce']
+    for key in ('r', 's'):
+        if key in fields:
+            result[key] = fields[key]
     return result
 
 
 def extract_txid_values(output: str) -> Dict:
     """Extract TXID values from txid mode output."""
+    fields = extract_all(output)
     result = {}
-    nonce_match = re.search(r'Nonce:\s*0x([0-9A-Fa-f]+)', output)
-    if nonce_match:
-        result['nonce'] = nonce_match.group(1).upper()
-    txid_match = re.search(r'TXID:\s*([0-9A-Fa-f]+)', output)
-    if txid_match:
-        result['txid'] = txid_match.group(1).upper()
+    if 'txid_nonce' in fields:
+        result['nonce'] = fields['txid_nonce']
+    if 'txid' in fields:
+        result['txid'] = fields['txid']
     return result
 
 
@@ -252,25 +417,30 @@ def verify_mask_result(privkey_hex: str, target: str, mask_hex: str = None) -> D
     """Verify mask mode result."""
     result = {'valid': False, 'pubkey_x': None, 'matches': False, 'error': None}
 
-    if not ECDSA_AVAILABLE:
-        result['error'] = 'ecdsa library not available'
+    if not EC_AVAILABLE:
+        result['error'] = 'coincurve/ecdsa library not available'
         return result
 
     try:
         d = int(privkey_hex, 16)
-        if d <= 0 or d >= SECP256k1.order:
+        if d <= 0 or d >= N:
             result['error'] = "Invalid private key: out of range"
             return result
 
         d_bytes = bytes.fromhex(privkey_hex.zfill(64))
-        sk = SigningKey.from_string(d_bytes, curve=SECP256k1)
-        pubkey = sk.get_verifying_key().to_string()
+        if COINCURVE_AVAILABLE:
+            pubkey = CCPrivateKey(d_bytes).public_key.format(compressed=False)[1:]
+        else:
+            SECP256k1, SigningKey = _ecdsa()
+            sk = SigningKey.from_string(d_bytes, curve=SECP256k1)
+            pubkey = sk.get_verifying_key().to_string()
         x_hex = pubkey[:32].hex().upper()
         result['pubkey_x'] = x_hex
         result['valid'] = True
 
         if mask_hex:
-            x_int = int(x_hex, 16)
+            # X straight from the key bytes rather than re-parsing x_hex
+            x_int = int.from_bytes(pubkey[:32], 'big')
             target_int = int(target.ljust(64, '0'), 16)
             mask_int = int(mask_hex, 16)
             result['matches'] = (x_int & mask_int) == (target_int & mask_int)
@@ -284,6 +454,38 @@ def verify_mask_result(privkey_hex: str, target: str, mask_hex: str = None) -> D
         return result
 
 
+def _der_signature(r: int, s: int) -> bytes:
+    """DER-encode an ECDSA (r, s) pair."""
+    def der_int(v: int) -> bytes:
+        b = v.to_bytes(32, 'big').lstrip(b'\x00') or b'\x00'
+        if b[0] & 0x80:
+            b = b'\x00' + b
+        return b'\x02' + bytes([len(b)]) + b
+
+    body = der_int(r) + der_int(s)
+    return b'\x30' + bytes([len(body)]) + body
+
+
+def _inverse_mod_n(x: int) -> int:
+    """Modular inverse mod the curve order."""
+    if GMPY2_AVAILABLE:
+        return int(gmpy2.invert(x, N))
+    return pow(x, -1, N)
+
+
+@lru_cache(maxsize=128)
+def _pubkey_for(d_hex: str):
+    """Public key d*G for a signing key; sig sweeps reuse FIXED_D, so this is computed once."""
+    d_int = int(d_hex, 16)
+    if d_int == 1:  # FIXED_D: P is G itself (Gy is even, hence the 02 prefix)
+        if COINCURVE_AVAILABLE:
+            return CCPublicKey(b'\x02' + Gx.to_bytes(32, 'big'))
+        return _ecdsa()[0].generator
+    if COINCURVE_AVAILABLE:
+        return CCPublicKey.from_secret(d_int.to_bytes(32, 'big'))
+    return d_int * _ecdsa()[0].generator
+
+
 def verify_ecdsa_signature(nonce_k: str, z: str, d: str, r: str, s: str) -> Dict:
     """Verify ECDSA signature."""
     result = {
@@ -291,8 +493,8 @@ def verify_ecdsa_signature(nonce_k: str, z: str, d: str, r: str, s: str) -> Dict
         'ecdsa_verify': False, 'low_s': False, 'error': None
     }
 
-    if not ECDSA_AVAILABLE:
-        result['error'] = 'ecdsa library not available'
+    if not EC_AVAILABLE:
+        result['error'] = 'coincurve/ecdsa library not available'
         return result
 
     try:
@@ -302,13 +504,16 @@ def verify_ecdsa_signature(nonce_k: str, z: str, d: str, r: str, s: str) -> Dict
         expected_r = int(r, 16)
         expected_s = int(s, 16)
 
-        G = SECP256k1.generator
-        R_point = k * G
-        computed_r = R_point.x() % N
+        if COINCURVE_AVAILABLE:
+            R_bytes = CCPrivateKey(k.to_bytes(32, 'big')).public_key.format(compressed=False)
+            computed_r = int.from_bytes(R_bytes[1:33], 'big') % N
+        else:
+            G = _ecdsa()[0].generator
+            computed_r = (k * G).x() % N
 
         result['r_matches'] = (computed_r == expected_r)
 
-        k_inv = pow(k, -1, N)
+        k_inv = _inverse_mod_n(k)
         computed_s = (k_inv * (z_int + computed_r * d_int)) % N
 
         if computed_s > N // 2:
@@ -317,13 +522,20 @@ def verify_ecdsa_signature(nonce_k: str, z: str, d: str, r: str, s: str) -> Dict
         result['low_s'] = (expected_s <= N // 2)
         result['s_matches'] = (computed_s == expected_s)
 
-        P = d_int * G
-        s_inv = pow(expected_s, -1, N)
-        u1 = (z_int * s_inv) % N
-        u2 = (expected_r * s_inv) % N
-        R_verify = u1 * G + u2 * P
+        if COINCURVE_AVAILABLE:
+            # secp256k1_ecdsa_verify on the prehashed z
+            P = _pubkey_for(d)
+            result['ecdsa_verify'] = P.verify(
+                _der_signature(expected_r, expected_s), z_int.to_bytes(32, 'big'), hasher=None
+            )
+        else:
+            P = _pubkey_for(d)
+            s_inv = _inverse_mod_n(expected_s)
+            u1 = (z_int * s_inv) % N
+            u2 = (expected_r * s_inv) % N
+            R_verify = u1 * G + u2 * P
+            result['ecdsa_verify'] = (R_verify.x() % N == expected_r)
 
-        result['ecdsa_verify'] = (R_verify.x() % N == expected_r)
         result['valid'] = all([
             result['r_matches'],
             result['s_matches'],
@@ -338,60 +550,161 @@ def verify_ecdsa_signature(nonce_k: str, z: str, d: str, r: str, s: str) -> Dict
         return result
 
 
-def verify_txid_result(raw_tx: str, nonce: str, nonce_offset: int, nonce_len: int, expected_prefix: str) -> Dict:
-    """Verify TXID grinding result."""
-    result = {'valid': False, 'txid': None, 'matches': False, 'error': None}
+@lru_cache(maxsize=32)
+def _tx_bytes(raw_tx: str) -> bytes:
+    """Parse a raw transaction once; every TXID test reuses MINIMAL_TX."""
+    return bytes.fromhex(raw_tx)
+
 
+def verify_txid_results(raw_tx: str, nonces: List[str], nonce_offset: int, nonce_len: int,
+                        expected_prefix: str) -> List[Dict]:
+    """Verify a batch of TXID grinding results against one raw transaction.
+
+    The bytes ahead of the nonce are hashed once and the primed SHA256 state
+    is copied per candidate, so each nonce only pays for the remaining blocks.
+    """
+    results = []
     try:
-        tx = bytearray.fromhex(raw_tx)
-        nonce_int = int(nonce, 16)
+        tx = _tx_bytes(raw_tx)
+    except ValueError as e:
+        return [{'valid': False, 'txid': None, 'matches': False, 'error': str(e)} for _ in nonces]
 
-        if nonce_offset + nonce_len > len(tx):
-            result['error'] = f"Nonce offset {nonce_offset} + len {nonce_len} exceeds TX length {len(tx)}"
-            return result
+    if nonce_offset + nonce_len > len(tx):
+        error = f"Nonce offset {nonce_offset} + len {nonce_len} exceeds TX length {len(tx)}"
+        return [{'valid': False, 'txid': None, 'matches': False, 'error': error} for _ in nonces]
 
-        for i in range(nonce_len):
-            tx[nonce_offset + i] = (nonce_int >> (i * 8)) & 0xFF
+    head = hashlib.sha256(tx[:nonce_offset])
+    tail = tx[nonce_offset + nonce_len:]
+    nonce_mask = (1 << (8 * nonce_len)) - 1
+    prefix = expected_prefix.upper()
 
-        hash1 = hashlib.sha256(bytes(tx)).digest()
-        hash2 = hashlib.sha256(hash1).digest()
+    for nonce in nonces:
+        result = {'valid': False, 'txid': None, 'matches': False, 'error': None}
+        try:
+            # Little-endian nonce, truncated to nonce_len bytes
+            nonce_bytes = (int(nonce, 16) & nonce_mask).to_bytes(nonce_len, 'little')
 
-        txid = hash2[::-1].hex().upper()
-        result['txid'] = txid
-        result['valid'] = True
-        result['matches'] = txid.startswith(expected_prefix.upper())
+            h = head.copy()
+            h.update(nonce_bytes)
+            h.update(tail)
+            hash2 = hashlib.sha256(h.digest()).digest()
 
-        return result
+            txid = hash2[::-1].hex().upper()
+            result['txid'] = txid
+            result['valid'] = True
+            result['matches'] = txid.startswith(prefix)
+        except Exception as e:
+            result['error'] = str(e)
+        results.append(result)
+
+    return results
 
-    except Exception as e:
-        result['error'] = str(e)
-        return result
+
+def verify_txid_result(raw_tx: str, nonce: str, nonce_offset: int, nonce_len: int, expected_prefix: str) -> Dict:
+    """Verify TXID grinding result."""
+    return verify_txid_results(raw_tx, [nonce], nonce_offset, nonce_len, expected_prefix)[0]
 
 
 # ============================================================================
 # EXPECTED DURATION CALCULATIONS
 # ============================================================================
 
+@lru_cache(maxsize=64)
 def expected_time_ec(bits: int, gkeys_per_sec: float = 27.0) -> float:
     """Calculate expected time for EC operations (mask, sig modes)."""
-    difficulty = 2 ** bits
+    difficulty = 1 << bits
     return difficulty / (gkeys_per_sec * 1e9)
 
 
+@lru_cache(maxsize=64)
 def expected_time_txid(bits: int, mkeys_per_sec: float = 10.0) -> float:
     """Calculate expected time for TXID operations."""
-    difficulty = 2 ** bits
+    difficulty = 1 << bits
     return difficulty / (mkeys_per_sec * 1e6)
 
 
+# ============================================================================
+# DEFERRED VERIFICATION
+# ============================================================================
+
+# --jobs N: quick/full suite tests run N at a time (benchmarks stay serial)
+JOBS = 1
+
+# With --fast-verify, mask and sig-ecdsa results are checked against the
+# values VanitySearch reports (MASK x, sig.r) without redoing the EC math.
+FAST_VERIFY = False
+
+# With --verify-workers, verify_* calls run in a process pool while the next
+# GPU run proceeds; VanitySearch runs themselves stay sequential.
+_VERIFY_POOL: Optional[ProcessPoolExecutor] = None
+_PENDING_VERIFY: List[Tuple[TestResult, Callable, Future]] = []
+
+
+def _unpin_worker(cpus: set) -> None:
+    """Pool initializer: widen a worker's inherited single-core mask."""
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+
+
+def start_verify_pool(workers: int) -> None:
+    """Route verification through a pool of worker processes."""
+    global _VERIFY_POOL
+    # Workers fork lazily from the (possibly pinned) harness, so hand them
+    # the cores --pin-affinity left to the VanitySearch runs
+    _VERIFY_POOL = ProcessPoolExecutor(max_workers=workers, initializer=_unpin_worker,
+                                       initargs=(_VANITY_CPUS,))
+
+
+def _verify(test_result: TestResult, apply: Callable, fn: Callable, *args) -> None:
+    """Run fn(*args) and pass its result to apply(test_result, ...), inline or via the pool."""
+    if _VERIFY_POOL is None:
+        apply(test_result, fn(*args))
+    else:
+        _PENDING_VERIFY.append((test_result, apply, _VERIFY_POOL.submit(fn, *args)))
+
+
+def resolve_verifications(suite: TestSuite) -> None:
+    """Wait for pooled verifications and apply them to their test results."""
+    for test_result, apply, future in _PENDING_VERIFY:
+        try:
+            apply(test_result, future.result())
+        except Exception as e:
+            test_result.error = f"Verification failed: {e}"
+        if test_result.verified:
+            suite.count_late_verification(test_result)
+    _PENDING_VERIFY.clear()
+
+
+def _apply_mask(test_result: TestResult, verify_result: Dict) -> None:
+    test_result.verified = verify_result.get('matches', False)
+    test_result.output_value = (verify_result.get('pubkey_x') or '')[:16] + '...'
+
+
+def _apply_sig(test_result: TestResult, verify_result: Dict) -> None:
+    test_result.verified = verify_result.get('valid', False)
+
+
+def _apply_txid(test_result: TestResult, verify_result: Dict) -> None:
+    test_result.verified = verify_result.get('matches', False)
+    test_result.output_value = f"TXID={(verify_result.get('txid') or '')[:8]}..."
+
+
+def status_of(result: TestResult) -> str:
+    """PASS/FAIL/ERROR for a grind test; RAN while its verification is still pooled."""
+    if not result.passed:
+        return "ERROR"
+    if any(pending is result for pending, _, _ in _PENDING_VERIFY):
+        return "RAN"
+    return "PASS" if result.verified else "FAIL"
+
+
 # ============================================================================
 # TEST DEFINITIONS
 # ============================================================================
 
 def test_mask(test_id: str, bits: int, target: str = None, use_gpu_monitor: bool = True) -> TestResult:
     """Run a mask mode test."""
-    if target is None:
-        target = random_hex(bits // 4)
+    target = random_hex(bits // 4) if target is None else target.upper()
 
     prefix_bytes = bits // 8
     args = ['-gpu', '-mask', '-tx', target, '--prefix', str(prefix_bytes), '-stop']
@@ -399,7 +712,8 @@ def test_mask(test_id: str, bits: int, target: str = None, use_gpu_monitor: bool
     expected_time = expected_time_ec(bits)
 
     if use_gpu_monitor:
-        result, gpu_stats = run_vanitysearch_with_gpu(args, 'mask', timeout=max(300, expected_time * 10))
+        result, gpu_stats = run_vanitysearch_with_gpu(args, 'mask', timeout=max(300, expected_time * 10),
+                                                      sample_interval=gpu_sample_interval(expected_time))
     else:
         result = run_vanitysearch(args, timeout=max(300, expected_time * 10))
         gpu_stats = {}
@@ -418,11 +732,14 @@ def test_mask(test_id: str, bits: int, target: str = None, use_gpu_monitor: bool
     )
 
     if result['success']:
-        privkey = extract_privkey(result['stdout'])
-        if privkey:
-            verify_result = verify_mask_result(privkey, target)
-            test_result.verified = verify_result.get('matches', False)
-            test_result.output_value = verify_result.get('pubkey_x', '')[:16] + '...'
+        pubkey_x = extract_pubkey_x(result['stdout']) if FAST_VERIFY else None
+        privkey = None if pubkey_x else extract_privkey(result['stdout'])
+        if pubkey_x:
+            # --fast-verify: trust the reported X instead of re-deriving d*G
+            test_result.verified = pubkey_x.startswith(target)
+            test_result.output_value = pubkey_x[:16] + '...'
+        elif privkey:
+            _verify(test_result, _apply_mask, verify_mask_result, privkey, target)
         else:
             test_result.error = "Could not extract private key"
     else:
@@ -433,8 +750,7 @@ def test_mask(test_id: str, bits: int, target: str = None, use_gpu_monitor: bool
 
 def test_sig_ecdsa(test_id: str, bits: int, target: str = None, z: str = FIXED_Z, d: str = FIXED_D, use_gpu_monitor: bool = True) -> TestResult:
     """Run an ECDSA signature mode test."""
-    if target is None:
-        target = random_hex(bits // 4)
+    target = random_hex(bits // 4) if target is None else target.upper()
 
     prefix_bytes = bits // 8
     args = ['-gpu', '-sig', '-tx', target, '--prefix', str(prefix_bytes), '-z', z, '-d', d, '-stop']
@@ -442,7 +758,8 @@ def test_sig_ecdsa(test_id: str, bits: int, target: str = None, z: str = FIXED_Z
     expected_time = expected_time_ec(bits)
 
     if use_gpu_monitor:
-        result, gpu_stats = run_vanitysearch_with_gpu(args, 'sig', timeout=max(300, expected_time * 10))
+        result, gpu_stats = run_vanitysearch_with_gpu(args, 'sig', timeout=max(300, expected_time * 10),
+                                                      sample_interval=gpu_sample_interval(expected_time))
     else:
         result = run_vanitysearch(args, timeout=max(300, expected_time * 10))
         gpu_stats = {}
@@ -463,10 +780,11 @@ def test_sig_ecdsa(test_id: str, bits: int, target: str = None, z: str = FIXED_Z
     if result['success']:
         sig_values = extract_sig_values(result['stdout'])
         if sig_values.get('nonce') and sig_values.get('r') and sig_values.get('s'):
-            verify_result = verify_ecdsa_signature(
-                sig_values['nonce'], z, d, sig_values['r'], sig_values['s']
-            )
-            test_result.verified = verify_result.get('valid', False)
+            if FAST_VERIFY:
+                test_result.verified = sig_values['r'].startswith(target)
+            else:
+                _verify(test_result, _apply_sig, verify_ecdsa_signature,
+                        sig_values['nonce'], z, d, sig_values['r'], sig_values['s'])
             test_result.output_value = f"R.x={sig_values['r'][:8]}..."
         else:
             test_result.error = "Could not extract signature values"
@@ -478,8 +796,7 @@ def test_sig_ecdsa(test_id: str, bits: int, target: str = None, z: str = FIXED_Z
 
 def test_sig_schnorr(test_id: str, bits: int, target: str = None, z: str = FIXED_Z, d: str = FIXED_D, use_gpu_monitor: bool = True) -> TestResult:
     """Run a Schnorr signature mode test."""
-    if target is None:
-        target = random_hex(bits // 4)
+    target = random_hex(bits // 4) if target is None else target.upper()
 
     prefix_bytes = bits // 8
     args = ['-gpu', '-sig', '--schnorr', '-tx', target, '--prefix', str(prefix_bytes), '-z', z, '-d', d, '-stop']
@@ -487,7 +804,8 @@ def test_sig_schnorr(test_id: str, bits: int, target: str = None, z: str = FIXED
     expected_time = expected_time_ec(bits)
 
     if use_gpu_monitor:
-        result, gpu_stats = run_vanitysearch_with_gpu(args, 'sig-schnorr', timeout=max(300, expected_time * 10))
+        result, gpu_stats = run_vanitysearch_with_gpu(args, 'sig-schnorr', timeout=max(300, expected_time * 10),
+                                                      sample_interval=gpu_sample_interval(expected_time))
     else:
         result = run_vanitysearch(args, timeout=max(300, expected_time * 10))
         gpu_stats = {}
@@ -509,7 +827,7 @@ def test_sig_schnorr(test_id: str, bits: int, target: str = None, z: str = FIXED
         sig_values = extract_sig_values(result['stdout'])
         if sig_values.get('r'):
             # For Schnorr, just verify R.x matches target (s-value uses different formula)
-            test_result.verified = sig_values['r'].startswith(target.upper())
+            test_result.verified = sig_values['r'].startswith(target)
             test_result.output_value = f"R.x={sig_values['r'][:8]}..."
         else:
             test_result.error = "Could not extract signature values"
@@ -521,8 +839,7 @@ def test_sig_schnorr(test_id: str, bits: int, target: str = None, z: str = FIXED
 
 def test_txid(test_id: str, bits: int, target: str = None, raw_tx: str = MINIMAL_TX, nonce_offset: int = None, nonce_len: int = 4, use_gpu_monitor: bool = True) -> TestResult:
     """Run a TXID mode test."""
-    if target is None:
-        target = random_hex(bits // 4)
+    target = random_hex(bits // 4) if target is None else target.upper()
 
     if nonce_offset is None:
         nonce_offset = len(raw_tx) // 2 - nonce_len  # Default: last bytes
@@ -533,7 +850,8 @@ def test_txid(test_id: str, bits: int, target: str = None, raw_tx: str = MINIMAL
     expected_time = expected_time_txid(bits)
 
     if use_gpu_monitor:
-        result, gpu_stats = run_vanitysearch_with_gpu(args, 'txid', timeout=max(300, expected_time * 10))
+        result, gpu_stats = run_vanitysearch_with_gpu(args, 'txid', timeout=max(300, expected_time * 10),
+                                                      sample_interval=gpu_sample_interval(expected_time))
     else:
         result = run_vanitysearch(args, timeout=max(300, expected_time * 10))
         gpu_stats = {}
@@ -554,9 +872,8 @@ def test_txid(test_id: str, bits: int, target: str = None, raw_tx: str = MINIMAL
     if result['success']:
         txid_values = extract_txid_values(result['stdout'])
         if txid_values.get('nonce'):
-            verify_result = verify_txid_result(raw_tx, txid_values['nonce'], nonce_offset, nonce_len, target)
-            test_result.verified = verify_result.get('matches', False)
-            test_result.output_value = f"TXID={verify_result.get('txid', '')[:8]}..."
+            _verify(test_result, _apply_txid, verify_txid_result,
+                    raw_tx, txid_values['nonce'], nonce_offset, nonce_len, target)
         else:
             test_result.error = "Could not extract nonce"
     else:
@@ -592,55 +909,76 @@ def test_error_handling(test_id: str, mode: str, args: List[str], expected_error
 # TEST SUITES
 # ============================================================================
 
+def _quick_test_groups() -> List[Tuple[str, Callable, str, List[int]]]:
+    """Quick suite as (section title, test function, test id prefix, bit sizes)."""
+    return [
+        ("MASK MODE TESTS", test_mask, "MASK", [8, 16, 24, 32]),
+        ("ECDSA SIGNATURE TESTS", test_sig_ecdsa, "SIG-ECDSA", [8, 16, 32]),
+        ("SCHNORR SIGNATURE TESTS", test_sig_schnorr, "SIG-SCHNORR", [8, 16, 32]),
+        ("TXID MODE TESTS", test_txid, "TXID", [8, 16]),
+    ]
+
+
+def _quick_test_specs() -> List[Tuple[str, Callable, int]]:
+    """Quick suite flattened to (test_id, test function, bits)."""
+    return [(f"{prefix}-{bits:03d}", fn, bits)
+            for _, fn, prefix, bit_sizes in _quick_test_groups() for bits in bit_sizes]
+
+
+def run_tests_parallel(suite: TestSuite, specs: List[Tuple[str, Callable, int]]) -> None:
+    """Run (test_id, fn, bits) specs on JOBS threads, reporting each as it finishes.
+
+    Each test is a VanitySearch subprocess wait, so threads suffice; results
+    are added to the suite in spec order.
+    """
+    print(f"\n[{len(specs)} TESTS, {JOBS} JOBS]")
+    results = {}
+    with ThreadPoolExecutor(max_workers=JOBS) as executor:
+        futures = {executor.submit(fn, test_id, bits): test_id for test_id, fn, bits in specs}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            print(f"  {result.test_id}: {result.bits}-bit prefix... {status_of(result)} ({result.elapsed:.2f}s)")
+
+    for test_id, _, _ in specs:
+        suite.add_result(results[test_id])
+
+
 def run_quick_tests(suite: TestSuite) -> None:
     """Run quick tests (32-bit and under, <5 minutes total)."""
     print("\n" + "=" * 70)
     print("QUICK TEST SUITE")
     print("=" * 70)
 
-    # MASK tests (8, 16, 24, 32 bits)
-    print("\n[MASK MODE TESTS]")
-    for bits in [8, 16, 24, 32]:
-        test_id = f"MASK-{bits:03d}"
-        print(f"  {test_id}: {bits}-bit prefix...", end=' ', flush=True)
-        result = test_mask(test_id, bits)
-        status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
-        print(f"{status} ({result.elapsed:.2f}s)")
-        suite.add_result(result)
+    if JOBS > 1:
+        run_tests_parallel(suite, _quick_test_specs())
+        return
 
-    # ECDSA Signature tests (8, 16, 32 bits)
-    print("\n[ECDSA SIGNATURE TESTS]")
-    for bits in [8, 16, 32]:
-        test_id = f"SIG-ECDSA-{bits:03d}"
-        print(f"  {test_id}: {bits}-bit prefix...", end=' ', flush=True)
-        result = test_sig_ecdsa(test_id, bits)
-        status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
-        print(f"{status} ({result.elapsed:.2f}s)")
-        suite.add_result(result)
-
-    # Schnorr Signature tests (8, 16, 32 bits)
-    print("\n[SCHNORR SIGNATURE TESTS]")
-    for bits in [8, 16, 32]:
-        test_id = f"SIG-SCHNORR-{bits:03d}"
-        print(f"  {test_id}: {bits}-bit prefix...", end=' ', flush=True)
-        result = test_sig_schnorr(test_id, bits)
-        status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
-        print(f"{status} ({result.elapsed:.2f}s)")
-        suite.add_result(result)
-
-    # TXID tests (8, 16 bits)
-    print("\n[TXID MODE TESTS]")
-    for bits in [8, 16]:
-        test_id = f"TXID-{bits:03d}"
-        print(f"  {test_id}: {bits}-bit prefix...", end=' ', flush=True)
-        result = test_txid(test_id, bits)
-        status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
-        print(f"{status} ({result.elapsed:.2f}s)")
-        suite.add_result(result)
+    for title, fn, prefix, bit_sizes in _quick_test_groups():
+        print(f"\n[{title}]")
+        for bits in bit_sizes:
+            test_id = f"{prefix}-{bits:03d}"
+            print(f"  {test_id}: {bits}-bit prefix...", end=' ', flush=True)
+            result = fn(test_id, bits)
+            status = status_of(result)
+            print(f"{status} ({result.elapsed:.2f}s)")
+            suite.add_result(result)
 
 
 def run_full_tests(suite: TestSuite) -> None:
     """Run full tests including 40-bit difficulty."""
+    if JOBS > 1:
+        # The long runs overlap with the quick ones instead of following them
+        print("\n" + "=" * 70)
+        print("FULL TEST SUITE (quick + extended)")
+        print("=" * 70)
+        run_tests_parallel(suite, _quick_test_specs() + [
+            ("MASK-040", test_mask, 40),
+            ("SIG-ECDSA-040", test_sig_ecdsa, 40),
+            ("TXID-024", test_txid, 24),
+        ])
+        return
+
     # First run quick tests
     run_quick_tests(suite)
 
@@ -651,19 +989,19 @@ def run_full_tests(suite: TestSuite) -> None:
     # 40-bit tests (longer running)
     print("\n[40-BIT MASK TEST] (~41s expected)")
     result = test_mask("MASK-040", 40)
-    status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
+    status = status_of(result)
     print(f"  MASK-040: {status} ({result.elapsed:.2f}s)")
     suite.add_result(result)
 
     print("\n[40-BIT ECDSA SIGNATURE TEST] (~41s expected)")
     result = test_sig_ecdsa("SIG-ECDSA-040", 40)
-    status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
+    status = status_of(result)
     print(f"  SIG-ECDSA-040: {status} ({result.elapsed:.2f}s)")
     suite.add_result(result)
 
     print("\n[24-BIT TXID TEST] (~27s expected)")
     result = test_txid("TXID-024", 24)
-    status = "PASS" if result.verified else ("FAIL" if result.passed else "ERROR")
+    status = status_of(result)
     print(f"  TXID-024: {status} ({result.elapsed:.2f}s)")
     suite.add_result(result)
 
@@ -682,12 +1020,20 @@ def run_error_tests(suite: TestSuite) -> None:
         ("ERR-008", "txid", ["-txid", "-tx", "DEAD"], "raw"),
     ]
 
-    for test_id, mode, args, expected_error in error_tests:
-        print(f"  {test_id}: {mode} error handling...", end=' ', flush=True)
-        result = test_error_handling(test_id, mode, args, expected_error)
-        status = "PASS" if result.passed else "FAIL"
-        print(f"{status}")
-        suite.add_result(result)
+    # Each case fails fast on argument validation without touching the GPU,
+    # so all of them run at once; printing stays on this thread
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(error_tests)) as executor:
+        futures = {executor.submit(test_error_handling, *spec): spec for spec in error_tests}
+        for future in as_completed(futures):
+            test_id, mode = futures[future][:2]
+            result = future.result()
+            results[test_id] = result
+            status = "PASS" if result.passed else "FAIL"
+            print(f"  {test_id}: {mode} error handling... {status}")
+
+    for test_id, _, _, _ in error_tests:
+        suite.add_result(results[test_id])
 
 
 def run_benchmark_tests(suite: TestSuite) -> None:
@@ -722,22 +1068,10 @@ def print_summary(suite: TestSuite) -> None:
         print(f"Verified: {suite.summary['verified']} ({suite.summary['verify_rate']})")
         print(f"GPU target met: {suite.summary['gpu_target_met']}")
 
-    # Group by mode
-    by_mode = {}
-    for r in suite.results:
-        mode = r.mode
-        if mode not in by_mode:
-            by_mode[mode] = []
-        by_mode[mode].append(r)
-
     print("\nBy Mode:")
-    for mode, results in sorted(by_mode.items()):
-        passed = sum(1 for r in results if r.passed)
-        verified = sum(1 for r in results if r.verified)
-        avg_time = sum(r.elapsed for r in results) / len(results)
-        avg_gpu = sum(r.gpu_util_avg for r in results) / len(results)
-        print(f"  {mode}: {passed}/{len(results)} passed, {verified}/{len(results)} verified, "
-              f"avg time: {avg_time:.2f}s, avg GPU: {avg_gpu:.1f}%")
+    for mode, (count, passed, verified, time_sum, gpu_sum, _) in sorted(suite.by_mode.items()):
+        print(f"  {mode}: {passed}/{count} passed, {verified}/{count} verified, "
+              f"avg time: {time_sum / count:.2f}s, avg GPU: {gpu_sum / count:.1f}%")
 
 
 def main():
@@ -747,6 +1081,15 @@ def main():
     parser.add_argument('--benchmark', action='store_true', help='Run performance benchmarks')
     parser.add_argument('--errors', action='store_true', help='Run error handling tests')
     parser.add_argument('--output', '-o', default='test_results.json', help='Output JSON file')
+    parser.add_argument('--verify-workers', type=int, default=0, metavar='N',
+                        help='Verify results in N worker processes while later GPU runs proceed')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Run quick/full tests N at a time (per-test GPU utilization then '
+                             'reflects the shared GPU; --benchmark always runs serially)')
+    parser.add_argument('--pin-affinity', action='store_true',
+                        help='Linux: pin the harness to one core and VanitySearch to the others')
+    parser.add_argument('--fast-verify', action='store_true',
+                        help='Check reported MASK x / sig.r against the target instead of re-deriving them')
     args = parser.parse_args()
 
     # Default to quick if nothing specified
@@ -764,9 +1107,9 @@ def main():
         print("Please build the project first.")
         sys.exit(1)
 
-    if not ECDSA_AVAILABLE:
-        print("\nWARNING: ecdsa library not available, verification disabled")
-        print("Install with: pip install ecdsa")
+    if not EC_AVAILABLE:
+        print("\nWARNING: coincurve/ecdsa library not available, verification disabled")
+        print("Install with: pip install coincurve")
 
     # Get GPU info
     gpu_info = get_gpu_info() if GPUMonitor else {'error': 'GPU monitoring not available'}
@@ -774,6 +1117,16 @@ def main():
         print(f"\nGPU: {gpu_info['name']}")
         print(f"Memory: {gpu_info.get('memory', 'Unknown')}")
 
+    global FAST_VERIFY, JOBS
+    FAST_VERIFY = args.fast_verify
+    JOBS = max(1, args.jobs)
+
+    if args.pin_affinity and not pin_affinity():
+        print("WARNING: --pin-affinity needs Linux and at least 2 usable cores, not pinning")
+
+    if args.verify_workers > 0:
+        start_verify_pool(args.verify_workers)
+
     # Create test suite
     suite_name = 'quick' if args.quick else ('full' if args.full else ('benchmark' if args.benchmark else 'errors'))
     suite = TestSuite(
@@ -781,6 +1134,8 @@ def main():
         started=datetime.now().isoformat(),
         gpu_info=gpu_info
     )
+    output_path = Path(__file__).parent / args.output
+    suite.open_partial(output_path.with_suffix('.partial.jsonl'))
 
     # Run tests
     if args.quick:
@@ -793,13 +1148,20 @@ def main():
     if args.errors or args.quick or args.full:
         run_error_tests(suite)
 
+    if _VERIFY_POOL is not None:
+        resolve_verifications(suite)
+        _VERIFY_POOL.shutdown()
+        print("\n[VERIFICATION]")
+        for result in suite.results:
+            if result.bits:
+                print(f"  {result.test_id}: {status_of(result)}")
+
     # Finalize and save
     suite.finalize()
     print_summary(suite)
 
-    output_path = Path(__file__).parent / args.output
-    with open(output_path, 'w') as f:
-        json.dump(suite.to_dict(), f, indent=2)
+    write_json(output_path, suite.to_dict())
+    suite.close_partial()
     print(f"\nResults saved to: {output_path}")
 
     # Exit with error code if any tests failed
@@ -6,12 +6,58 @@ Monitors GPU utilization during test execution to ensure
 the GPU is being saturated (target: 90-95% for EC ops, 60-65% for TXID).
 """
 
+import atexit
+import collections
+import functools
 import subprocess
 import threading
 import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
+# Prefer NVML (pip install nvidia-ml-py) over forking nvidia-smi per query.
+# The handle is opened once at import and shared by every helper below.
+try:
+    import pynvml
+    pynvml.nvmlInit()
+    _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+    atexit.register(pynvml.nvmlShutdown)
+    NVML_AVAILABLE = True
+except Exception:
+    _NVML_HANDLE = None
+    NVML_AVAILABLE = False
+
+
+def _nvml_str(value) -> str:
+    """NVML string getters return bytes on older nvidia-ml-py releases."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# GPM metrics (Hopper+) read in a single nvmlGpmMetricsGet call per sample:
+# overall utilization, SM occupancy and DRAM bandwidth utilization.
+_GPM_METRICS = ('GRAPHICS_UTIL', 'SM_OCCUPANCY', 'DRAM_BW_UTIL')
+
+
+def _gpm_supported(handle) -> bool:
+    """Check whether the device exposes GPM performance counters."""
+    try:
+        return bool(pynvml.nvmlGpmQueryDeviceSupport(handle).isSupportedDevice)
+    except Exception:
+        return False
+
+
+def _gpm_metrics(sample1, sample2) -> List[float]:
+    """Compute the _GPM_METRICS values over the interval between two samples."""
+    metrics_get = pynvml.c_nvmlGpmMetricsGet_t()
+    metrics_get.version = pynvml.NVML_GPM_METRICS_GET_VERSION
+    metrics_get.numMetrics = len(_GPM_METRICS)
+    metrics_get.sample1 = sample1
+    metrics_get.sample2 = sample2
+    for i, name in enumerate(_GPM_METRICS):
+        metrics_get.metrics[i].metricId = getattr(pynvml, f'NVML_GPM_METRIC_{name}')
+    pynvml.nvmlGpmMetricsGet(metrics_get)
+    return [metrics_get.metrics[i].value for i in range(len(_GPM_METRICS))]
+
 
 @dataclass
 class GPUStats:
@@ -23,6 +69,9 @@ class GPUStats:
     sample_count: int = 0
     duration_seconds: float = 0.0
     error: Optional[str] = None
+    # NVML-only diagnostics (0.0 when sampled via nvidia-smi)
+    avg_sm_occupancy: float = 0.0
+    avg_dram_active: float = 0.0
 
     @property
     def target_met_ec(self) -> bool:
@@ -41,6 +90,8 @@ class GPUStats:
             'avg': round(self.avg_util, 2),
             'samples': self.sample_count,
             'duration_seconds': round(self.duration_seconds, 2),
+            'avg_sm_occupancy': round(self.avg_sm_occupancy, 2),
+            'avg_dram_active': round(self.avg_dram_active, 2),
             'target_met_ec': self.target_met_ec,
             'target_met_txid': self.target_met_txid,
             'error': self.error
@@ -51,6 +102,12 @@ class GPUMonitor:
     """
     Monitor GPU utilization in a background thread.
 
+    Samples through NVML when available: GPM counters on Hopper and newer
+    (utilization, SM occupancy, DRAM bandwidth in one call), otherwise
+    nvmlDeviceGetUtilizationRates. Falls back to polling nvidia-smi.
+    The sampler waits on an event between samples, so stop() returns
+    immediately even with a long sample_interval.
+
     Usage:
         monitor = GPUMonitor()
         monitor.start()
@@ -59,30 +116,35 @@ class GPUMonitor:
         print(f"Average GPU: {stats.avg_util}%")
     """
 
-    def __init__(self, sample_interval: float = 0.5, gpu_id: int = 0):
+    def __init__(self, sample_interval: float = 0.5, gpu_id: int = 0, keep_samples: bool = False,
+                 max_samples: int = 1024):
         """
         Initialize GPU monitor.
 
         Args:
             sample_interval: Time between samples in seconds
             gpu_id: GPU index to monitor (default: 0)
+            keep_samples: Return the raw series in GPUStats.samples
+            max_samples: Most recent samples kept for keep_samples (stats cover all)
         """
         self.sample_interval = sample_interval
         self.gpu_id = gpu_id
-        self._samples: List[int] = []
-        self._running = False
+        self.keep_samples = keep_samples
+        self.max_samples = max_samples
+        self._reset()
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._start_time: float = 0.0
         self._error: Optional[str] = None
 
     def start(self) -> None:
         """Start monitoring GPU utilization in background thread."""
-        if self._running:
+        if self._thread is not None and self._thread.is_alive():
             return
 
-        self._samples = []
+        self._reset()
         self._error = None
-        self._running = True
+        self._stop_event.clear()
         self._start_time = time.time()
         self._thread = threading.Thread(target=self._sample_loop, daemon=True)
         self._thread.start()
@@ -94,7 +156,7 @@ class GPUMonitor:
         Returns:
             GPUStats with min/max/avg utilization and sample data
         """
-        self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
 
@@ -103,40 +165,74 @@ class GPUMonitor:
         if self._error:
             return GPUStats(error=self._error, duration_seconds=duration)
 
-        if not self._samples:
+        if not self._util_count:
             return GPUStats(error="No samples collected", duration_seconds=duration)
 
         return GPUStats(
-            min_util=min(self._samples),
-            max_util=max(self._samples),
-            avg_util=sum(self._samples) / len(self._samples),
-            samples=self._samples.copy(),
-            sample_count=len(self._samples),
-            duration_seconds=duration
+            min_util=self._util_min,
+            max_util=self._util_max,
+            avg_util=self._util_sum / self._util_count,
+            samples=list(self._samples) if self.keep_samples else [],
+            sample_count=self._util_count,
+            duration_seconds=duration,
+            avg_sm_occupancy=self._sm_sum / self._sm_count if self._sm_count else 0.0,
+            avg_dram_active=self._dram_sum / self._dram_count if self._dram_count else 0.0
         )
 
+    def _reset(self) -> None:
+        """Clear the running statistics and the bounded sample window."""
+        self._samples = collections.deque(maxlen=self.max_samples)
+        self._util_min = self._util_max = self._util_sum = self._util_count = 0
+        self._sm_sum, self._sm_count = 0.0, 0
+        self._dram_sum, self._dram_count = 0.0, 0
+
+    def _record(self, util: int, sm_occupancy: Optional[float] = None,
+                dram_active: Optional[float] = None) -> None:
+        """Fold one sample into the running min/max/sum (O(1) per sample)."""
+        if self._util_count:
+            self._util_min = min(self._util_min, util)
+            self._util_max = max(self._util_max, util)
+        else:
+            self._util_min = self._util_max = util
+        self._util_sum += util
+        self._util_count += 1
+        if self.keep_samples:
+            self._samples.append(util)
+        if sm_occupancy is not None:
+            self._sm_sum += sm_occupancy
+            self._sm_count += 1
+        if dram_active is not None:
+            self._dram_sum += dram_active
+            self._dram_count += 1
+
     def _sample_loop(self) -> None:
         """Background thread that samples GPU utilization."""
-        while self._running:
+        if NVML_AVAILABLE:
+            self._nvml_sample_loop()
+            return
+
+        cmd = [
+            'nvidia-smi',
+            f'--id={self.gpu_id}',
+            '--query-gpu=utilization.gpu',
+            '--format=csv,noheader,nounits'
+        ]
+        while not self._stop_event.is_set():
             try:
+                # Bytes output: int() and isdigit() work without a decode per sample
                 result = subprocess.run(
-                    [
-                        'nvidia-smi',
-                        f'--id={self.gpu_id}',
-                        '--query-gpu=utilization.gpu',
-                        '--format=csv,noheader,nounits'
-                    ],
+                    cmd,
+                    stdin=subprocess.DEVNULL,
                     capture_output=True,
-                    text=True,
                     timeout=2.0
                 )
 
                 if result.returncode == 0:
                     util_str = result.stdout.strip()
                     if util_str.isdigit():
-                        self._samples.append(int(util_str))
+                        self._record(int(util_str))
                 else:
-                    self._error = f"nvidia-smi failed: {result.stderr}"
+                    self._error = f"nvidia-smi failed: {result.stderr.decode(errors='replace')}"
 
             except subprocess.TimeoutExpired:
                 self._error = "nvidia-smi timeout"
@@ -145,16 +241,67 @@ class GPUMonitor:
             except Exception as e:
                 self._error = str(e)
 
-            time.sleep(self.sample_interval)
+            self._stop_event.wait(self.sample_interval)
 
+    def _nvml_sample_loop(self) -> None:
+        """Sample via NVML: GPM deltas when supported, else utilization rates."""
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(self.gpu_id)
+        except Exception as e:
+            self._error = f"NVML device {self.gpu_id}: {e}"
+            return
 
+        gpm = _gpm_supported(handle)
+        if gpm:
+            # GPM metrics are deltas between two samples; take the first one
+            # up front and swap the buffers after each read.
+            prev_sample = pynvml.nvmlGpmSampleAlloc()
+            cur_sample = pynvml.nvmlGpmSampleAlloc()
+            pynvml.nvmlGpmSampleGet(handle, prev_sample)
+            self._stop_event.wait(self.sample_interval)
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if gpm:
+                        pynvml.nvmlGpmSampleGet(handle, cur_sample)
+                        util, sm_occ, dram = _gpm_metrics(prev_sample, cur_sample)
+                        prev_sample, cur_sample = cur_sample, prev_sample
+                    else:
+                        rates = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                        util, sm_occ, dram = rates.gpu, None, rates.memory
+                    self._record(int(round(util)), sm_occ, dram)
+                except Exception as e:
+                    self._error = str(e)
+
+                self._stop_event.wait(self.sample_interval)
+        finally:
+            if gpm:
+                pynvml.nvmlGpmSampleFree(prev_sample)
+                pynvml.nvmlGpmSampleFree(cur_sample)
+
+
+@functools.lru_cache(maxsize=1)
 def get_gpu_info() -> Dict:
     """
-    Get GPU information.
+    Get GPU information (queried once per process; treat the dict as read-only).
 
     Returns:
         Dict with GPU name, memory, driver version, etc.
     """
+    if NVML_AVAILABLE:
+        try:
+            mem = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLE)
+            cuda = pynvml.nvmlSystemGetCudaDriverVersion()
+            return {
+                'name': _nvml_str(pynvml.nvmlDeviceGetName(_NVML_HANDLE)),
+                'memory': f"{mem.total >> 20} MiB",
+                'driver': _nvml_str(pynvml.nvmlSystemGetDriverVersion()),
+                'cuda': f"{cuda // 1000}.{(cuda % 1000) // 10}"
+            }
+        except Exception:
+            pass  # Fall through to nvidia-smi
+
     try:
         result = subprocess.run(
             [
@@ -182,6 +329,7 @@ def get_gpu_info() -> Dict:
         return {'error': str(e)}
 
 
+@functools.lru_cache(maxsize=1)
 def check_gpu_available() -> bool:
     """Check if nvidia-smi is available and a GPU is present."""
     try:
@@ -261,6 +409,19 @@ def get_gpu_memory() -> Dict:
     Returns:
         Dict with used_mb, total_mb, and percent
     """
+    if NVML_AVAILABLE:
+        try:
+            mem = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLE)
+            used = mem.used >> 20
+            total = mem.total >> 20
+            return {
+                'used_mb': used,
+                'total_mb': total,
+                'percent': round(used / total * 100, 1) if total > 0 else 0
+            }
+        except Exception:
+            pass  # Fall through to nvidia-smi
+
     try:
         result = subprocess.run(
             [
@@ -339,6 +500,9 @@ if __name__ == '__main__':
     print(f"Min utilization: {stats.min_util}%")
     print(f"Max utilization: {stats.max_util}%")
     print(f"Avg utilization: {stats.avg_util:.1f}%")
+    if NVML_AVAILABLE:
+        print(f"Avg SM occupancy: {stats.avg_sm_occupancy:.1f}%")
+        print(f"Avg DRAM active: {stats.avg_dram_active:.1f}%")
     print(f"Duration: {stats.duration_seconds:.1f}s")
 
     if stats.error:
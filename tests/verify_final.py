@@ -1,37 +1,58 @@
 #!/usr/bin/env python3
 """Verify the taproot key found by VanitySearch."""
 import hashlib
-from ecdsa import SECP256k1
+
+# coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PrivateKey, PublicKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    from ecdsa import SECP256k1
+    COINCURVE_AVAILABLE = False
+
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# SHA256 states primed with SHA256(tag) || SHA256(tag), exactly one block
+_TAG_PREFIXES = {}
 
 def tagged_hash(tag: bytes, data: bytes) -> bytes:
     """BIP-340 tagged hash: SHA256(SHA256(tag) || SHA256(tag) || data)"""
-    tag_hash = hashlib.sha256(tag).digest()
-    return hashlib.sha256(tag_hash + tag_hash + data).digest()
+    prefix = _TAG_PREFIXES.get(tag)
+    if prefix is None:
+        tag_hash = hashlib.sha256(tag).digest()
+        prefix = _TAG_PREFIXES[tag] = hashlib.sha256(tag_hash + tag_hash)
+    h = prefix.copy()
+    h.update(data)
+    return h.digest()
 
 # Key found by VanitySearch
 d_hex = "A4210AD32FEA0A8C1D8B11F63886A835FE5D0C00BAC883E7FFBA9C876C00D2EC"
 d = int(d_hex, 16)
 
-# Compute P = d * G
-G = SECP256k1.generator
-P = d * G
-
-# Get P.x as bytes (32 bytes, big endian)
-P_x = P.x()
-P_x_bytes = P_x.to_bytes(32, 'big')
+# Compute P = d * G, and get P.x as bytes (32 bytes, big endian)
+if COINCURVE_AVAILABLE:
+    P = PrivateKey(d.to_bytes(32, 'big')).public_key
+    P_x_bytes = P.format()[1:]
+else:
+    G = SECP256k1.generator
+    P = d * G
+    P_x_bytes = P.x().to_bytes(32, 'big')
 print(f"d (private key): {d_hex}")
 print(f"P.x (internal):  {P_x_bytes.hex().upper()}")
 
 # Compute t = TapTweak(P.x)
 t_bytes = tagged_hash(b"TapTweak", P_x_bytes)
-t = int.from_bytes(t_bytes, 'big') % SECP256k1.order
+t = int.from_bytes(t_bytes, 'big') % N
 print(f"t (tweak):       {t_bytes.hex().upper()}")
 
 # Compute Q = P + t*G
-tG = t * G
-Q = P + tG
-Q_x = Q.x()
-Q_x_bytes = Q_x.to_bytes(32, 'big')
+if COINCURVE_AVAILABLE:
+    tG = PrivateKey(t.to_bytes(32, 'big')).public_key
+    Q_x_bytes = PublicKey.combine_keys([P, tG]).format()[1:]
+else:
+    tG = t * G
+    Q = P + tG
+    Q_x_bytes = Q.x().to_bytes(32, 'big')
 print(f"Q.x (output):    {Q_x_bytes.hex().upper()}")
 
 # Check if Q.x starts with 0000
@@ -3,16 +3,41 @@
 Verify GPU taproot computation against Python implementation.
 Compares P.x, tweak hash, t*G, and Q values.
 """
+import argparse
 import hashlib
-from ecdsa import SECP256k1
+
+# coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PrivateKey, PublicKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    from ecdsa import SECP256k1
+    COINCURVE_AVAILABLE = False
+
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+FIELD_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+SQRT_EXP = (FIELD_P + 1) // 4  # p = 3 mod 4, so sqrt(a) = a^((p+1)/4)
+
+# SHA256 states primed with SHA256(tag) || SHA256(tag), exactly one block
+_TAG_PREFIXES = {}
 
 def tagged_hash(tag: bytes, data: bytes) -> bytes:
     """BIP-340 tagged hash: SHA256(SHA256(tag) || SHA256(tag) || data)"""
-    tag_hash = hashlib.sha256(tag).digest()
-    return hashlib.sha256(tag_hash + tag_hash + data).digest()
+    prefix = _TAG_PREFIXES.get(tag)
+    if prefix is None:
+        tag_hash = hashlib.sha256(tag).digest()
+        prefix = _TAG_PREFIXES[tag] = hashlib.sha256(tag_hash + tag_hash)
+    h = prefix.copy()
+    h.update(data)
+    return h.digest()
+
+def verify_gpu_match(px_hex: str, gpu_tweak_hex: str, gpu_tgx_hex: str, gpu_qx_hex: str,
+                     both: bool = False):
+    """Verify GPU computed values against Python implementation.
 
-def verify_gpu_match(px_hex: str, gpu_tweak_hex: str, gpu_tgx_hex: str, gpu_qx_hex: str):
-    """Verify GPU computed values against Python implementation."""
+    Taproot lifts P.x to the even-y point (BIP-340), so only that Q is
+    computed unless both is set.
+    """
     print("=" * 70)
     print("VERIFYING GPU TAPROOT COMPUTATION")
     print("=" * 70)
@@ -32,10 +57,14 @@ def verify_gpu_match(px_hex: str, gpu_tweak_hex: str, gpu_tgx_hex: str, gpu_qx_h
     print(f"  Match:  {'YES' if gpu_tweak_hex.replace(' ', '') == python_tweak_hex else 'NO'}")
 
     # Compute t*G in Python
-    t_int = int.from_bytes(python_tweak, 'big') % SECP256k1.order
-    G = SECP256k1.generator
-    tG = t_int * G
-    python_tgx_hex = format(tG.x(), '064X')
+    t_int = int.from_bytes(python_tweak, 'big') % N
+    if COINCURVE_AVAILABLE:
+        tG = PrivateKey(t_int.to_bytes(32, 'big')).public_key
+        python_tgx_hex = tG.format()[1:].hex().upper()
+    else:
+        G = SECP256k1.generator
+        tG = t_int * G
+        python_tgx_hex = tG.x().to_bytes(32, 'big').hex().upper()
     print(f"\nt*G.x:")
     print(f"  GPU:    {gpu_tgx_hex.replace(' ', '')}")
     print(f"  Python: {python_tgx_hex}")
@@ -43,36 +72,60 @@ def verify_gpu_match(px_hex: str, gpu_tweak_hex: str, gpu_tgx_hex: str, gpu_qx_h
 
     # To compute Q, we need P (both x and y)
     # We only have P.x from GPU, so we can lift the y-coordinate
-    # There are 2 possible y values - we'll try both
-    p = SECP256k1.curve.p()
+    # There are 2 possible y values; taproot uses the even one
+    parities = ('even', 'odd') if both else ('even',)
+    if COINCURVE_AVAILABLE:
+        # Lift x via libsecp256k1: 02 = even y, 03 = odd y
+        for parity in parities:
+            prefix = b'\x02' if parity == 'even' else b'\x03'
+            try:
+                P = PublicKey(prefix + px_bytes)
+            except ValueError:
+                print("\nERROR: P.x is not on the secp256k1 curve!")
+                return
+            qx_hex = PublicKey.combine_keys([P, tG]).format()[1:].hex().upper()
+            print(f"\nQ.x (with y_{parity}):")
+            print(f"  GPU:    {gpu_qx_hex.replace(' ', '')}")
+            print(f"  Python: {qx_hex}")
+            if gpu_qx_hex.replace(' ', '') == qx_hex:
+                print(f"  Match:  YES (P.y = {parity})")
+            else:
+                print(f"  Match:  NO")
+        return
+
+    p = FIELD_P
     y_squared = (pow(px_int, 3, p) + 7) % p
 
     # Check if y_squared is a quadratic residue
-    y = pow(y_squared, (p + 1) // 4, p)
+    y = pow(y_squared, SQRT_EXP, p)
     if pow(y, 2, p) != y_squared:
         print("\nERROR: P.x is not on the secp256k1 curve!")
         return
 
-    # Try both y values
-    y1 = y
-    y2 = p - y
+    y_even = y if y % 2 == 0 else p - y
 
     from ecdsa.ellipticcurve import Point
     curve = SECP256k1.curve
 
-    for i, y_val in enumerate([y1, y2]):
+    for parity in parities:
+        y_val = y_even if parity == 'even' else p - y_even
         P = Point(curve, px_int, y_val)
         Q = P + tG
-        qx_hex = format(Q.x(), '064X')
-        print(f"\nQ.x (with y{'_even' if y_val == y1 else '_odd'}):")
+        qx_hex = Q.x().to_bytes(32, 'big').hex().upper()
+        print(f"\nQ.x (with y_{parity}):")
         print(f"  GPU:    {gpu_qx_hex.replace(' ', '')}")
         print(f"  Python: {qx_hex}")
         if gpu_qx_hex.replace(' ', '') == qx_hex:
-            print(f"  Match:  YES (P.y = {'even' if y_val == y1 else 'odd'})")
+            print(f"  Match:  YES (P.y = {parity})")
         else:
             print(f"  Match:  NO")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--both', action='store_true',
+                        help='Also compute Q from the odd-y lift of P.x (debug)')
+    args = parser.parse_args()
+
     # Values from latest test (tid=6619)
     # GPU TAPROOT DEBUG (tid=6619):
     #   P.x:    A984034525915842 5BF98FB0F019AFDD 8A44068101E93D60 4575EC8D01F11908
@@ -84,5 +137,6 @@ if __name__ == "__main__":
         px_hex="A984034525915842 5BF98FB0F019AFDD 8A44068101E93D60 4575EC8D01F11908",
         gpu_tweak_hex="BABF1B4A6F2DBEEE 2EE91F1A556258A9 BF9B3B81031CEDDF 90A6700C8A0897F7",
         gpu_tgx_hex="67E6ABEC346EBEC5 BA2C90070F936A31 C23AE76F4BBA188A 0035269E1FAFD6FF",
-        gpu_qx_hex="0000959D41FA2E5A 0B219E2BD175F4FE E77FFC9FC3D1700D 3C0684E550DD9C82"
+        gpu_qx_hex="0000959D41FA2E5A 0B219E2BD175F4FE E77FFC9FC3D1700D 3C0684E550DD9C82",
+        both=args.both
     )
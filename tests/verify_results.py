@@ -2,16 +2,32 @@
 """
 VanityMask output verification script.
 Independently verifies cryptographic correctness of grinding results.
+Scalar multiplication uses coincurve (libsecp256k1) when installed.
 
 Usage:
     python verify_results.py mask <privkey_hex> <expected_prefix>
     python verify_results.py sig <nonce_hex> <msg_hash> <privkey> <r_hex> <s_hex> [--schnorr]
     python verify_results.py txid <raw_tx_hex> <nonce_hex> <nonce_offset> <nonce_len> <expected_prefix>
+    python verify_results.py txid-batch <raw_tx_hex> <nonce_file> <nonce_offset> <nonce_len> <expected_prefix>
+
+Set VANITYMASK_VERBOSE=1 to print tracebacks for unexpected errors.
+Set VANITYMASK_DOUBLE_CHECK=1 to also run full ECDSA verification in sig mode.
 """
 
+import os
 import sys
+import mmap
+import struct
 import hashlib
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional
+
+# coincurve (libsecp256k1) for scalar multiplication, pure-Python fallback
+try:
+    from coincurve import PrivateKey, PublicKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
 
 # secp256k1 curve parameters
 P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
@@ -22,25 +38,25 @@ Gy = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
 # Point at infinity represented as None
 INFINITY = None
 
+# Print tracebacks for unexpected errors (VANITYMASK_VERBOSE=1)
+VERBOSE = bool(os.environ.get('VANITYMASK_VERBOSE'))
+
+# Re-verify sig results as a full ECDSA signature (VANITYMASK_DOUBLE_CHECK=1)
+DOUBLE_CHECK = bool(os.environ.get('VANITYMASK_DOUBLE_CHECK'))
+
 
 def modinv(a: int, m: int) -> int:
-    """Modular inverse using extended Euclidean algorithm"""
-    if a < 0:
-        a = a % m
-    g, x, _ = extended_gcd(a, m)
-    if g != 1:
-        raise ValueError(f"Modular inverse does not exist for {a} mod {m}")
-    return x % m
+    """Modular inverse (built-in pow, Python 3.8+)"""
+    a = a % m
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        raise ValueError(f"Modular inverse does not exist for {a} mod {m}") from None
 
 
-def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
-    """Extended Euclidean algorithm"""
-    if a == 0:
-        return b, 0, 1
-    gcd, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    return gcd, x, y
+def hex256(x: int) -> str:
+    """64-char lowercase hex of a scalar or coordinate (x < 2^256)"""
+    return x.to_bytes(32, 'big').hex()
 
 
 def point_add(p1: Optional[Tuple[int, int]], p2: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
@@ -73,7 +89,7 @@ def point_add(p1: Optional[Tuple[int, int]], p2: Optional[Tuple[int, int]]) -> O
 
 
 def point_mul(k: int, p: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
-    """Scalar multiplication k * P using double-and-add"""
+    """Scalar multiplication k * P, in libsecp256k1 when coincurve is installed"""
     if k == 0 or p is INFINITY:
         return INFINITY
 
@@ -81,16 +97,154 @@ def point_mul(k: int, p: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]
     if k == 0:
         return INFINITY
 
-    result = INFINITY
-    addend = p
+    if COINCURVE_AVAILABLE:
+        if p == (Gx, Gy):
+            return PrivateKey.from_int(k).public_key.point()
+        return PublicKey.from_point(*p).multiply(k.to_bytes(32, 'big')).point()
+
+    return point_mul_py(k, p)
+
+
+def point_dbl_jac(p: Optional[Tuple[int, int, int]]) -> Optional[Tuple[int, int, int]]:
+    """Double a Jacobian point (X, Y, Z), x = X/Z^2, y = Y/Z^3 (a = 0)"""
+    if p is INFINITY:
+        return INFINITY
+
+    x1, y1, z1 = p
+    if y1 == 0:
+        return INFINITY
+
+    yy = y1 * y1 % P
+    s = 4 * x1 * yy % P
+    m = 3 * x1 * x1 % P
+    x3 = (m * m - 2 * s) % P
+    y3 = (m * (s - x3) - 8 * yy * yy) % P
+    z3 = 2 * y1 * z1 % P
+
+    return (x3, y3, z3)
 
-    while k > 0:
+
+def point_add_jac(p1: Optional[Tuple[int, int, int]], p2: Tuple[int, int]) -> Optional[Tuple[int, int, int]]:
+    """Add an affine point p2 to a Jacobian point p1, without inversion"""
+    if p1 is INFINITY:
+        return (p2[0], p2[1], 1)
+
+    x1, y1, z1 = p1
+    x2, y2 = p2
+
+    zz = z1 * z1 % P
+    h = (x2 * zz - x1) % P
+    r = (y2 * z1 * zz - y1) % P
+
+    if h == 0:
+        # Same x: doubling, or Point + (-Point) = infinity
+        return point_dbl_jac(p1) if r == 0 else INFINITY
+
+    hh = h * h % P
+    hhh = h * hh % P
+    v = x1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - y1 * hhh) % P
+    z3 = z1 * h % P
+
+    return (x3, y3, z3)
+
+
+def jac_to_affine(p: Optional[Tuple[int, int, int]]) -> Optional[Tuple[int, int]]:
+    """Normalize a Jacobian point with a single inversion"""
+    if p is INFINITY:
+        return INFINITY
+
+    x, y, z = p
+    z_inv = modinv(z, P)
+    z_inv2 = z_inv * z_inv % P
+
+    return (x * z_inv2 % P, y * z_inv2 * z_inv % P)
+
+
+# wNAF window: digits are odd in [-15, 15], table holds P, 3P, ..., 15P
+WNAF_WIDTH = 5
+
+
+def precompute_odd_multiples(p: Tuple[int, int], w: int = WNAF_WIDTH) -> list:
+    """Affine odd multiples [P, 3P, 5P, ..., (2^(w-1) - 1)P]"""
+    p2 = point_add(p, p)
+    table = [p]
+    for _ in range((1 << (w - 2)) - 1):
+        table.append(point_add(table[-1], p2))
+    return table
+
+
+def wnaf(k: int, w: int = WNAF_WIDTH) -> list:
+    """Width-w NAF digits of k, least significant first"""
+    digits = []
+    while k:
         if k & 1:
-            result = point_add(result, addend)
-        addend = point_add(addend, addend)
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
         k >>= 1
+    return digits
 
-    return result
+
+def point_mul_wnaf(k: int, table: list) -> Optional[Tuple[int, int]]:
+    """k * P from P's odd-multiple table, in Jacobian coordinates"""
+    result = INFINITY
+
+    for d in reversed(wnaf(k)):
+        result = point_dbl_jac(result)
+        if d > 0:
+            result = point_add_jac(result, table[d >> 1])
+        elif d < 0:
+            x, y = table[-d >> 1]
+            result = point_add_jac(result, (x, P - y))
+
+    return jac_to_affine(result)
+
+
+# Fixed-base comb for G: row j holds i * 2^(COMB_WIDTH*j) * G for every
+# COMB_WIDTH-bit digit i, so k*G is one add per nonzero digit, no doublings
+COMB_WIDTH = 4
+
+
+@lru_cache(maxsize=1)
+def g_comb() -> list:
+    """Comb table for G, built on the first pure-Python k*G (~1k affine points)"""
+    size = 1 << COMB_WIDTH
+    comb = []
+    base = (Gx, Gy)
+    for _ in range(256 // COMB_WIDTH):
+        row = [INFINITY, base]
+        for _ in range(size - 2):
+            row.append(point_add(row[-1], base))
+        comb.append(row)
+        base = point_add(row[size // 2], row[size // 2])
+    return comb
+
+
+def point_mul_g(k: int) -> Optional[Tuple[int, int]]:
+    """k * G from the comb table (0 < k < N)"""
+    digit_mask = (1 << COMB_WIDTH) - 1
+    result = INFINITY
+
+    for row in g_comb():
+        digit = k & digit_mask
+        if digit:
+            result = point_add_jac(result, row[digit])
+        k >>= COMB_WIDTH
+
+    return jac_to_affine(result)
+
+
+def point_mul_py(k: int, p: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """Scalar multiplication k * P in pure Python (0 < k < N)"""
+    if p == (Gx, Gy):
+        return point_mul_g(k)
+    return point_mul_wnaf(k, precompute_odd_multiples(p))
 
 
 def verify_mask(privkey_hex: str, expected_prefix: str) -> bool:
@@ -117,7 +271,7 @@ def verify_mask(privkey_hex: str, expected_prefix: str) -> bool:
             print(f"  ERROR: Public key is point at infinity")
             return False
 
-        x_hex = format(pubkey[0], '064x')
+        x_hex = hex256(pubkey[0])
         expected_lower = expected_prefix.lower()
 
         if x_hex.startswith(expected_lower):
@@ -176,9 +330,9 @@ def verify_signature(nonce_hex: str, msg_hash_hex: str, privkey_hex: str,
             if r != expected_r:
                 print(f"  ERROR: r mismatch.")
                 print(f"    Expected: {format(expected_r, '064x')}")
-                print(f"    Got:      {format(r, '064x')}")
+                print(f"    Got:      {hex256(r)}")
                 return False
-            print(f"  OK: Schnorr R.x = {format(r, '064x')[:16]}... matches")
+            print(f"  OK: Schnorr R.x = {hex256(r)[:16]}... matches")
             # For Schnorr, s computation is different (BIP340), skip s verification
             return True
 
@@ -186,7 +340,7 @@ def verify_signature(nonce_hex: str, msg_hash_hex: str, privkey_hex: str,
         if r != expected_r:
             print(f"  ERROR: r mismatch.")
             print(f"    Expected: {format(expected_r, '064x')}")
-            print(f"    Got:      {format(r, '064x')}")
+            print(f"    Got:      {hex256(r)}")
             return False
 
         # Compute s = k^-1 * (z + r*d) mod n
@@ -200,37 +354,55 @@ def verify_signature(nonce_hex: str, msg_hash_hex: str, privkey_hex: str,
         if s != expected_s:
             print(f"  ERROR: s mismatch.")
             print(f"    Expected: {format(expected_s, '064x')}")
-            print(f"    Got:      {format(s, '064x')}")
+            print(f"    Got:      {hex256(s)}")
             # Also show non-normalized s
             s_raw = (k_inv * (z + r * d)) % N
-            print(f"    Raw s:    {format(s_raw, '064x')}")
+            print(f"    Raw s:    {hex256(s_raw)}")
             return False
 
-        print(f"  OK: r = {format(r, '064x')[:16]}...")
-        print(f"  OK: s = {format(s, '064x')[:16]}... (low-s normalized)")
+        print(f"  OK: r = {hex256(r)[:16]}...")
+        print(f"  OK: s = {hex256(s)[:16]}... (low-s normalized)")
 
         # Optional: Verify signature using ECDSA verification
-        # s^-1 * (z*G + r*P) should equal R
-        s_inv = modinv(s, N)
-        P = point_mul(d, G)  # Public key
-        u1 = (z * s_inv) % N
-        u2 = (r * s_inv) % N
-        R_verify = point_add(point_mul(u1, G), point_mul(u2, P))
-
-        if R_verify is INFINITY or R_verify[0] % N != r:
-            print(f"  WARNING: ECDSA verification failed (may be due to low-s adjustment)")
-        else:
-            print(f"  OK: ECDSA signature verification passed")
+        # s^-1 * (z*G + r*P) should equal R. Informational only, and three
+        # more scalar mults than the r/s recomputation above needs.
+        if DOUBLE_CHECK:
+            s_inv = modinv(s, N)
+            pubkey = point_mul(d, G)
+            u1 = (z * s_inv) % N
+            u2 = (r * s_inv) % N
+            R_verify = point_add(point_mul(u1, G), point_mul(u2, pubkey))
+
+            if R_verify is INFINITY or R_verify[0] % N != r:
+                print(f"  WARNING: ECDSA verification failed (may be due to low-s adjustment)")
+            else:
+                print(f"  OK: ECDSA signature verification passed")
 
         return True
 
     except Exception as e:
         print(f"  ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
         return False
 
 
+# struct formats for the common nonce widths, written with one pack_into
+NONCE_FORMATS = {1: '<B', 2: '<H', 4: '<I', 8: '<Q'}
+
+
+def patch_nonce(tx: bytearray, nonce: int, nonce_offset: int, nonce_len: int) -> None:
+    """Write nonce little-endian at nonce_offset; bytes past the end of tx are dropped"""
+    n = max(0, min(nonce_len, len(tx) - nonce_offset))
+    nonce &= (1 << (8 * n)) - 1
+    fmt = NONCE_FORMATS.get(n)
+    if fmt:
+        struct.pack_into(fmt, tx, nonce_offset, nonce)
+    else:
+        tx[nonce_offset:nonce_offset + n] = nonce.to_bytes(n, 'little')
+
+
 def verify_txid(raw_tx_hex: str, nonce_hex: str, nonce_offset: int,
                 nonce_len: int, expected_prefix: str) -> bool:
     """
@@ -254,12 +426,10 @@ def verify_txid(raw_tx_hex: str, nonce_hex: str, nonce_offset: int,
         nonce = int(nonce_hex, 16)
 
         # Insert nonce at offset (little-endian)
-        for i in range(nonce_len):
-            if nonce_offset + i < len(tx):
-                tx[nonce_offset + i] = (nonce >> (i * 8)) & 0xFF
+        patch_nonce(tx, nonce, nonce_offset, nonce_len)
 
         # Double SHA256
-        hash1 = hashlib.sha256(bytes(tx)).digest()
+        hash1 = hashlib.sha256(tx).digest()  # bytearray hashed in place, no copy
         hash2 = hashlib.sha256(hash1).digest()
 
         # Reverse for display (Bitcoin TXID convention)
@@ -277,42 +447,73 @@ def verify_txid(raw_tx_hex: str, nonce_hex: str, nonce_offset: int,
 
     except Exception as e:
         print(f"  ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
         return False
 
 
+def verify_txid_batch(raw_tx_hex: str, nonces: List[int], nonce_offset: int,
+                      nonce_len: int, expected_prefix: str) -> List[bool]:
+    """
+    Check many nonces against one base transaction.
+
+    The transaction is parsed once and each nonce is patched into the same
+    buffer before hashing, so a run's whole nonce log costs one allocation.
+
+    Returns:
+        Per-nonce flags, True where the TXID starts with expected prefix
+    """
+    tx = bytearray.fromhex(raw_tx_hex)
+    expected_lower = expected_prefix.lower()
+    sha256 = hashlib.sha256
+    results = []
+    for nonce in nonces:
+        patch_nonce(tx, nonce, nonce_offset, nonce_len)
+        txid = sha256(sha256(tx).digest()).digest()[::-1].hex()
+        results.append(txid.startswith(expected_lower))
+    return results
+
+
+# "Nonce (k)" must precede "Nonce"; lines may end in \r\n or be \r-separated
+# progress updates. Compiled on first use since no CLI mode parses files.
+OUTPUT_FIELDS_PATTERN = rb"""
+    (?:^|(?<=\r))\s*(?P<key>Priv\ \(HEX\)|Nonce\ \(k\)|sig\.r|sig\.s|Nonce|TXID)
+    :\s*(?:0x)?(?P<val>\S+)
+"""
+
+OUTPUT_FIELD_KEYS = {
+    b'Priv (HEX)': 'privkey',
+    b'Nonce (k)': 'nonce',
+    b'sig.r': 'r',
+    b'sig.s': 's',
+    b'Nonce': 'txid_nonce',
+    b'TXID': 'txid',
+}
+
+
+@lru_cache(maxsize=1)
+def output_fields_re():
+    """One-pass bytes regex over VanityMask output"""
+    import re
+    return re.compile(OUTPUT_FIELDS_PATTERN, re.MULTILINE | re.VERBOSE)
+
+
 def parse_output_file(filename: str) -> dict:
     """Parse VanityMask output file to extract values"""
     result = {}
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('Priv (HEX):'):
-                    # Extract hex value after 0x
-                    hex_val = line.split(':')[1].strip()
-                    if hex_val.startswith('0x'):
-                        hex_val = hex_val[2:]
-                    result['privkey'] = hex_val
-                elif line.startswith('Nonce (k):'):
-                    hex_val = line.split(':')[1].strip()
-                    if hex_val.startswith('0x'):
-                        hex_val = hex_val[2:]
-                    result['nonce'] = hex_val
-                elif line.startswith('sig.r:'):
-                    result['r'] = line.split(':')[1].strip()
-                elif line.startswith('sig.s:'):
-                    result['s'] = line.split(':')[1].strip()
-                elif line.startswith('Nonce:'):
-                    hex_val = line.split(':')[1].strip()
-                    if hex_val.startswith('0x'):
-                        hex_val = hex_val[2:]
-                    result['txid_nonce'] = hex_val
-                elif line.startswith('TXID:'):
-                    result['txid'] = line.split(':')[1].strip()
+        f = open(filename, 'rb')
     except FileNotFoundError:
         print(f"  ERROR: Output file not found: {filename}")
+        return result
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return result  # mmap rejects empty files
+        # Scan the mapped bytes directly, no per-line str objects
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for m in output_fields_re().finditer(data):
+                result[OUTPUT_FIELD_KEYS[m['key']]] = m['val'].decode()
     return result
 
 
@@ -357,6 +558,20 @@ def main():
         success = verify_txid(raw_tx, nonce, offset, length, prefix)
         sys.exit(0 if success else 1)
 
+    elif mode == 'txid-batch':
+        if len(sys.argv) < 7:
+            print("Usage: verify_results.py txid-batch <raw_tx> <nonce_file> <offset> <len> <prefix>")
+            sys.exit(1)
+        with open(sys.argv[3]) as f:
+            nonce_hexes = f.read().split()
+        results = verify_txid_batch(sys.argv[2], [int(n, 16) for n in nonce_hexes],
+                                    int(sys.argv[4]), int(sys.argv[5]), sys.argv[6])
+        for nonce_hex, ok in zip(nonce_hexes, results):
+            if not ok:
+                print(f"  ERROR: nonce {nonce_hex} does NOT give TXID prefix {sys.argv[6].lower()}")
+        print(f"  {sum(results)}/{len(results)} nonces verified")
+        sys.exit(0 if all(results) else 1)
+
     elif mode == 'test':
         # Run built-in self-tests
         print("=== Running self-tests ===\n")
@@ -378,7 +593,7 @@ def main():
         # Private key 1 should give pubkey 0279BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
         print("[TEST] Verify pubkey for private key 1")
         P = point_mul(1, (Gx, Gy))
-        x_hex = format(P[0], '064x')
+        x_hex = hex256(P[0])
         expected_x = '79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798'
         assert x_hex == expected_x, f"Expected {expected_x}, got {x_hex}"
         print(f"  OK: pubkey.x = {x_hex[:16]}...")
@@ -403,7 +618,7 @@ def main():
 
     else:
         print(f"Unknown mode: {mode}")
-        print("Modes: mask, sig, txid, test")
+        print("Modes: mask, sig, txid, txid-batch, test")
         sys.exit(1)
 
 
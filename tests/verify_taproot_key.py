@@ -4,12 +4,29 @@ Verify taproot key computation matches GPU output.
 Tests: P.x, TapTweak hash, Q.x
 """
 import hashlib
-from ecdsa import SECP256k1
+
+# coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PrivateKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    from ecdsa import SECP256k1
+    COINCURVE_AVAILABLE = False
+
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# SHA256 states primed with SHA256(tag) || SHA256(tag), exactly one block
+_TAG_PREFIXES = {}
 
 def tagged_hash(tag: bytes, data: bytes) -> bytes:
     """BIP-340 tagged hash: SHA256(SHA256(tag) || SHA256(tag) || data)"""
-    tag_hash = hashlib.sha256(tag).digest()
-    return hashlib.sha256(tag_hash + tag_hash + data).digest()
+    prefix = _TAG_PREFIXES.get(tag)
+    if prefix is None:
+        tag_hash = hashlib.sha256(tag).digest()
+        prefix = _TAG_PREFIXES[tag] = hashlib.sha256(tag_hash + tag_hash)
+    h = prefix.copy()
+    h.update(data)
+    return h.digest()
 
 def verify_taproot_key(privkey_hex: str):
     """Verify taproot key computation for a given private key."""
@@ -20,27 +37,32 @@ def verify_taproot_key(privkey_hex: str):
     d = int(privkey_hex, 16)
 
     # Compute P = d * G
-    G = SECP256k1.generator
-    P = d * G
-    P_x = P.x()
-    P_y = P.y()
-
-    P_x_bytes = P_x.to_bytes(32, 'big')
+    if COINCURVE_AVAILABLE:
+        P = PrivateKey(d.to_bytes(32, 'big')).public_key
+        P_x_bytes = P.format()[1:]
+    else:
+        G = SECP256k1.generator
+        P = d * G
+        P_x_bytes = P.x().to_bytes(32, 'big')
     print(f"P.x = {P_x_bytes.hex().upper()}")
     print(f"P.x MSB (64 bits) = {P_x_bytes[:8].hex().upper()}")
 
     # Compute t = TapTweak(P.x)
     t_bytes = tagged_hash(b"TapTweak", P_x_bytes)
-    t = int.from_bytes(t_bytes, 'big') % SECP256k1.order
+    t = int.from_bytes(t_bytes, 'big') % N
     print(f"t (TapTweak) = {t_bytes.hex().upper()}")
 
-    # Compute t*G
-    tG = t * G
-    print(f"t*G.x = {tG.x().to_bytes(32, 'big').hex().upper()}")
-
-    # Compute Q = P + t*G
-    Q = P + tG
-    Q_x_bytes = Q.x().to_bytes(32, 'big')
+    # Compute t*G, then Q = P + t*G (libsecp256k1 tweak-add on the coincurve path)
+    if COINCURVE_AVAILABLE:
+        t_scalar = t.to_bytes(32, 'big')
+        tG = PrivateKey(t_scalar).public_key
+        print(f"t*G.x = {tG.format()[1:].hex().upper()}")
+        Q_x_bytes = P.add(t_scalar).format()[1:]
+    else:
+        tG = t * G
+        print(f"t*G.x = {tG.x().to_bytes(32, 'big').hex().upper()}")
+        Q = P + tG
+        Q_x_bytes = Q.x().to_bytes(32, 'big')
     print(f"Q.x = {Q_x_bytes.hex().upper()}")
     print(f"Q.x MSB (64 bits) = {Q_x_bytes[:8].hex().upper()}")
 
@@ -4,12 +4,29 @@ Verify GPU SHA256_TapTweak matches Python implementation.
 Tests the byte order fix (bswap32) in GPU/GPUHash.h
 """
 import hashlib
-from ecdsa import SECP256k1
+
+# coincurve (libsecp256k1) preferred, pure-Python ecdsa fallback
+try:
+    from coincurve import PrivateKey
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    from ecdsa import SECP256k1
+    COINCURVE_AVAILABLE = False
+
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# SHA256 states primed with SHA256(tag) || SHA256(tag), exactly one block
+_TAG_PREFIXES = {}
 
 def tagged_hash(tag: bytes, data: bytes) -> bytes:
     """BIP-340 tagged hash: SHA256(SHA256(tag) || SHA256(tag) || data)"""
-    tag_hash = hashlib.sha256(tag).digest()
-    return hashlib.sha256(tag_hash + tag_hash + data).digest()
+    prefix = _TAG_PREFIXES.get(tag)
+    if prefix is None:
+        tag_hash = hashlib.sha256(tag).digest()
+        prefix = _TAG_PREFIXES[tag] = hashlib.sha256(tag_hash + tag_hash)
+    h = prefix.copy()
+    h.update(data)
+    return h.digest()
 
 def compute_taptweak(px_hex: str) -> str:
     """Compute TapTweak hash for a given P.x"""
@@ -25,7 +42,7 @@ def compute_Q(px_hex: str, py_hex: str = None) -> tuple:
 
     # Compute tweak
     t = tagged_hash(b"TapTweak", px_bytes)
-    t_int = int.from_bytes(t, 'big') % SECP256k1.order
+    t_int = int.from_bytes(t, 'big') % N
 
     # If we have the full point, compute Q = P + t*G
     # For now, just return the tweak
@@ -71,16 +88,20 @@ def test_known_key():
     t_hex, t_int = compute_Q(px_hex)
     print(f"t = TapTweak(P.x) = {t_hex}")
 
-    # Compute t*G
-    G = SECP256k1.generator
-    tG = t_int * G
-    print(f"t*G.x = {tG.x():064X}")
-    print(f"t*G.y = {tG.y():064X}")
-
-    # Compute Q = P + t*G = G + t*G = (1+t)*G
-    Q = (1 + t_int) * G
-    print(f"Q.x = {Q.x():064X}")
-    print(f"Q.y = {Q.y():064X}")
+    # Compute t*G, and Q = P + t*G = G + t*G = (1+t)*G
+    if COINCURVE_AVAILABLE:
+        tG_x, tG_y = PrivateKey.from_int(t_int).public_key.point()
+        Q_x, Q_y = PrivateKey.from_int((1 + t_int) % N).public_key.point()
+    else:
+        G = SECP256k1.generator
+        tG = t_int * G
+        tG_x, tG_y = tG.x(), tG.y()
+        Q = (1 + t_int) * G
+        Q_x, Q_y = Q.x(), Q.y()
+    print(f"t*G.x = {tG_x.to_bytes(32, 'big').hex().upper()}")
+    print(f"t*G.y = {tG_y.to_bytes(32, 'big').hex().upper()}")
+    print(f"Q.x = {Q_x.to_bytes(32, 'big').hex().upper()}")
+    print(f"Q.y = {Q_y.to_bytes(32, 'big').hex().upper()}")
     print()
 
 def test_from_output():
@@ -5,7 +5,7 @@ Tests all modes and functions with hardware monitoring.
 Generates detailed reports with GPU/CPU utilization metrics.
 
 Usage:
-    python vanity_comprehensive_test.py [--windows-only] [--wsl-only] [--quick]
+    python vanity_comprehensive_test.py [--windows-only] [--wsl-only] [--quick] [--persistent] [--fast]
 """
 
 import subprocess
@@ -14,13 +14,30 @@ import time
 import os
 import sys
 import csv
+import io
 import re
 import json
+import statistics
 import argparse
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
+from operator import attrgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer NVML (pip install nvidia-ml-py) over forking nvidia-smi per sample.
+# The harness runs on the Windows host for both platforms, so one handle to
+# the local GPU serves the WSL runs too.
+try:
+    import pynvml
+    pynvml.nvmlInit()
+    NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+    NVML_AVAILABLE = True
+except Exception:
+    NVML_HANDLE = None
+    NVML_AVAILABLE = False
 
 # ==============================================================================
 # CONFIGURATION
@@ -28,6 +45,10 @@ from dataclasses import dataclass, field, asdict
 
 WINDOWS_EXE = r"x64\Release\VanitySearch.exe"
 WSL_EXE = "/mnt/c/pirqjobs/vanitymask-workshop/VanityMask-wsl-test/VanitySearch"
+WSL_WORKDIR = "/mnt/c/pirqjobs/vanitymask-workshop"
+
+# Children only talk through pipes; on the Windows host don't give each one a console
+SPAWN_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
 # Test data
 MSG_HASH = "0102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f20"
@@ -51,11 +72,63 @@ RAW_TX = (
 # Expected G point X coordinate
 G_X = "79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798"
 
+# Throughput patterns, e.g. [27542.81 Mkey/s] or [GPU 26144.42 Mkey/s]
+RE_BRACKET_RATE = re.compile(r'\[([\d.]+)\s*(M|G)?key/s\]', re.IGNORECASE)
+RE_BARE_RATE = re.compile(r'([\d.]+)\s*(M|G)?key/s', re.IGNORECASE)
+RE_UNIT_RATE = re.compile(r'([\d.]+)\s*(M|G)key/s', re.IGNORECASE)
+# Rate criteria look at the last this-many characters first (steady state)
+RATE_TAIL_CHARS = 8192
+
+
+def last_match(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    """Return the last match of pattern in text, or None."""
+    match = None
+    for match in pattern.finditer(text):
+        pass
+    return match
+
+
+# Pass criteria -> needle groups, matched against the lowercased output. Every
+# group needs one hit; needles are tried in order, so the likeliest go first.
+CRITERIA_NEEDLES: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "found": (("found", "priv", "address"),),
+    # VanityMask is currently version 1.19
+    "version_119": (("1.19", "1.20"),),
+    "usage": (("usage", "-gpu"),),
+    "gpu": (("gpu", "cuda", "4090"),),
+    "ok": (("ok", "check"),),
+    # Looking for a Bitcoin address in output (starts with 1, 3, or bc1)
+    "address": (("1", "address"),),
+    "priv": (("priv",),),
+    "pub": (("pub", "04", "02", "03"),),
+    # CPU mask mode should output MASK: prefix with matching X coordinate
+    "mask_found": (("mask:",), ("priv",)),
+    # Check if the output file was written (find result)
+    "file_written": (("found", "priv"),),
+    # Should show error for invalid Base58 characters
+    "error_invalid": (("invalid", "error", "argument"),),
+    # Should show error for missing required argument
+    "error_missing": (("error", "missing", "require", "target"),),
+}
+
+# Lines of VanitySearch output kept per test for logs and criteria checks
+OUTPUT_TAIL_LINES = 1000
+# Of those, lines written to the .log of a passing test
+LOG_TAIL_LINES = 200
+# With --fast, consecutive rate samples above a rate>X threshold that end a sustained test early
+EARLY_EXIT_SAMPLES = 3
+
+# Persistent mode: one "VanitySearch --server" process runs the search tests
+# (one argument line per job on stdin, each job's output ends with @@DONE),
+# so CUDA init is paid once per platform rather than once per test
+SERVER_FLAG = "--server"
+DONE_LINE = "@@DONE"
+
 # ==============================================================================
 # DATA CLASSES
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HardwareMetrics:
     """Container for hardware metrics at a point in time."""
     timestamp: str = ""
@@ -69,7 +142,7 @@ class HardwareMetrics:
     process_gpu_mem: float = 0.0   # Per-process GPU memory
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Container for a single test result."""
     test_id: str
@@ -84,7 +157,7 @@ class TestResult:
     metrics_max: Optional[HardwareMetrics] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestDefinition:
     """Definition of a single test case."""
     test_id: str
@@ -93,6 +166,7 @@ class TestDefinition:
     timeout: int  # seconds
     pass_criteria: str
     sustained_load: bool = False  # If True, timeout is expected
+    exclusive: bool = True  # If False, doesn't touch the GPU and may run in parallel
 
 
 # ==============================================================================
@@ -273,44 +347,44 @@ def get_test_definitions(quick_mode: bool = False) -> List[TestDefinition]:
     tests.append(TestDefinition(
         "ERR-01", "Invalid prefix char",
         ["-stop", "1Invalid0OIl"],  # Contains invalid base58 chars
-        timeout=10, pass_criteria="error_invalid", sustained_load=False
+        timeout=10, pass_criteria="error_invalid", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "ERR-02", "Missing mask target",
         ["-mask", "-stop"],  # Missing -tx argument
-        timeout=10, pass_criteria="error_missing", sustained_load=False
+        timeout=10, pass_criteria="error_missing", sustained_load=False, exclusive=False
     ))
 
     # --- Utility Function Tests ---
     tests.append(TestDefinition(
         "UTIL-01", "Version check",
         ["-v"],
-        timeout=10, pass_criteria="version_119", sustained_load=False
+        timeout=10, pass_criteria="version_119", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "UTIL-02", "Help output",
         ["-h"],
-        timeout=10, pass_criteria="usage", sustained_load=False
+        timeout=10, pass_criteria="usage", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "UTIL-03", "List GPUs",
         ["-l"],
-        timeout=10, pass_criteria="gpu", sustained_load=False
+        timeout=10, pass_criteria="gpu", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "UTIL-04", "Compute address",
         ["-ca", "0479BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8"],  # G point uncompressed
-        timeout=10, pass_criteria="address", sustained_load=False
+        timeout=10, pass_criteria="address", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "UTIL-05", "Key pair gen",
         ["-s", "AStrongTestSeedPassphrase1234567890", "-kp"],  # -s before -kp, no spaces
-        timeout=10, pass_criteria="priv", sustained_load=False
+        timeout=10, pass_criteria="priv", sustained_load=False, exclusive=False
     ))
     tests.append(TestDefinition(
         "UTIL-06", "Compute pubkey",
         ["-cp", PRIVKEY_1],
-        timeout=10, pass_criteria="pub", sustained_load=False
+        timeout=10, pass_criteria="pub", sustained_load=False, exclusive=False
     ))
 
     return tests
@@ -320,6 +394,34 @@ def get_test_definitions(quick_mode: bool = False) -> List[TestDefinition]:
 # HARDWARE MONITOR
 # ==============================================================================
 
+# Fields summarized by finish_test, kept as running sums/maxes per sample
+SUMMARY_FIELDS = ("gpu_util", "gpu_mem_util", "gpu_temp", "gpu_power", "gpu_mem_used")
+_summary_values = attrgetter(*SUMMARY_FIELDS)
+
+# Adaptive sampling (NVML only - nvidia-smi is too slow to fork at 10 Hz):
+# fast through the startup ramp and whenever utilization is moving, slow on
+# a steady plateau
+MONITOR_FAST_INTERVAL = 0.1
+MONITOR_SLOW_INTERVAL = 1.0
+MONITOR_RAMP_SECONDS = 5.0
+MONITOR_STABLE_STDEV = 5.0  # % util over the last MONITOR_WINDOW samples
+MONITOR_UTIL_DROP = 20.0  # % util fall between samples that re-triggers fast sampling
+MONITOR_WINDOW = 5
+METRICS_CSV_FIELDS = ("timestamp", "gpu_util", "gpu_mem_util", "gpu_temp", "gpu_power",
+                      "gpu_mem_used", "process_gpu_util", "process_gpu_mem")
+_metrics_row = attrgetter(*METRICS_CSV_FIELDS)
+
+
+def write_metrics_csv(filepath: Path, metrics: List[HardwareMetrics]):
+    """Format the whole CSV in memory and write it in one call."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(METRICS_CSV_FIELDS)
+    writer.writerows(map(_metrics_row, metrics))
+    with open(filepath, 'w', newline='') as f:
+        f.write(buf.getvalue())
+
+
 class HardwareMonitor:
     """Monitors GPU and CPU metrics during tests."""
 
@@ -327,12 +429,23 @@ class HardwareMonitor:
         self.platform = platform
         self.running = False
         self.gpu_data: List[HardwareMetrics] = []
+        self.weights: List[float] = []  # Seconds each gpu_data sample stands for
         self.threads: List[threading.Thread] = []
+        self.current_test: Optional[str] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._window_start = 0
+        self._window_time = time.monotonic()
+        self._sums = [0.0] * len(SUMMARY_FIELDS)
+        self._maxes = [0.0] * len(SUMMARY_FIELDS)
+        self._weight = 0.0
 
     def start(self):
         """Start monitoring in background thread."""
         self.running = True
         self.gpu_data = []
+        self.weights = []
+        self.mark_test(None)
 
         gpu_thread = threading.Thread(target=self._monitor_gpu, daemon=True)
         gpu_thread.start()
@@ -341,80 +454,137 @@ class HardwareMonitor:
     def stop(self):
         """Stop monitoring and collect data."""
         self.running = False
+        self._wake.set()
         for t in self.threads:
             t.join(timeout=2)
         self.threads = []
 
+    def mark_test(self, test_id: Optional[str]):
+        """Open a new summary window; later samples belong to test_id."""
+        with self._lock:
+            self.current_test = test_id
+            self._window_start = len(self.gpu_data)
+            self._window_time = time.monotonic()
+            self._sums = [0.0] * len(SUMMARY_FIELDS)
+            self._maxes = [0.0] * len(SUMMARY_FIELDS)
+            self._weight = 0.0
+        if test_id is not None:
+            self._wake.set()  # Sample right away, as a freshly started monitor would
+
     def _monitor_gpu(self):
-        """Query nvidia-smi every second."""
+        """Sample the GPU (NVML at an adaptive rate, else nvidia-smi every second)."""
+        recent = deque(maxlen=MONITOR_WINDOW)
         while self.running:
+            interval = MONITOR_SLOW_INTERVAL
             try:
-                if self.platform == "windows":
-                    result = subprocess.run(
-                        ["nvidia-smi",
-                         "--query-gpu=utilization.gpu,utilization.memory,temperature.gpu,power.draw,memory.used",
-                         "--format=csv,noheader,nounits"],
-                        capture_output=True, text=True, timeout=5
-                    )
-                else:
-                    # WSL - run nvidia-smi through Windows
-                    result = subprocess.run(
-                        ["nvidia-smi.exe",
-                         "--query-gpu=utilization.gpu,utilization.memory,temperature.gpu,power.draw,memory.used",
-                         "--format=csv,noheader,nounits"],
-                        capture_output=True, text=True, timeout=5
-                    )
-
-                if result.returncode == 0:
-                    parts = result.stdout.strip().split(",")
-                    if len(parts) >= 5:
-                        metrics = HardwareMetrics(
-                            timestamp=datetime.now().isoformat(),
-                            gpu_util=float(parts[0].strip()),
-                            gpu_mem_util=float(parts[1].strip()),
-                            gpu_temp=float(parts[2].strip()),
-                            gpu_power=float(parts[3].strip()),
-                            gpu_mem_used=float(parts[4].strip())
-                        )
-                        self.gpu_data.append(metrics)
+                metrics = self._nvml_sample() if NVML_AVAILABLE else self._smi_sample()
+                if metrics:
+                    recent.append(metrics.gpu_util)
+                    if NVML_AVAILABLE:
+                        interval = self._next_interval(recent, time.monotonic() - self._window_time)
+                    self._record(metrics, interval)
             except Exception as e:
                 pass  # Silently ignore monitoring errors
 
-            time.sleep(1)
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    @staticmethod
+    def _next_interval(recent: deque, elapsed: float) -> float:
+        """Sample fast during the ramp and while utilization is unsettled."""
+        if elapsed < MONITOR_RAMP_SECONDS or len(recent) < 2:
+            return MONITOR_FAST_INTERVAL
+        if recent[-2] - recent[-1] > MONITOR_UTIL_DROP:
+            return MONITOR_FAST_INTERVAL
+        if statistics.pstdev(recent) > MONITOR_STABLE_STDEV:
+            return MONITOR_FAST_INTERVAL
+        return MONITOR_SLOW_INTERVAL
+
+    def _record(self, metrics: HardwareMetrics, weight: float = 1.0):
+        """Store a sample and fold it into the running sums and maxes.
+
+        weight is the time the sample stands for, so averages stay
+        time-weighted when the sampling rate changes.
+        """
+        values = _summary_values(metrics)
+        with self._lock:
+            if len(self.gpu_data) == self._window_start:
+                self._maxes = list(values)
+            else:
+                self._maxes = [max(a, b) for a, b in zip(self._maxes, values)]
+            self._sums = [a + b * weight for a, b in zip(self._sums, values)]
+            self._weight += weight
+            self.gpu_data.append(metrics)
+            self.weights.append(weight)
+
+    def _nvml_sample(self) -> HardwareMetrics:
+        """Read one sample through in-process NVML calls."""
+        rates = pynvml.nvmlDeviceGetUtilizationRates(NVML_HANDLE)
+        return HardwareMetrics(
+            timestamp=datetime.now().isoformat(),
+            gpu_util=float(rates.gpu),
+            gpu_mem_util=float(rates.memory),
+            gpu_temp=float(pynvml.nvmlDeviceGetTemperature(NVML_HANDLE, pynvml.NVML_TEMPERATURE_GPU)),
+            gpu_power=pynvml.nvmlDeviceGetPowerUsage(NVML_HANDLE) / 1000,  # mW -> W
+            gpu_mem_used=pynvml.nvmlDeviceGetMemoryInfo(NVML_HANDLE).used / (1024 * 1024)  # MiB, as nvidia-smi
+        )
 
-    def get_summary(self) -> Tuple[Optional[HardwareMetrics], Optional[HardwareMetrics]]:
-        """Return average and max metrics."""
-        if not self.gpu_data:
+    def _smi_sample(self) -> Optional[HardwareMetrics]:
+        """Read one sample by running nvidia-smi."""
+        if self.platform == "windows":
+            result = subprocess.run(
+                ["nvidia-smi",
+                 "--query-gpu=utilization.gpu,utilization.memory,temperature.gpu,power.draw,memory.used",
+                 "--format=csv,noheader,nounits"],
+                capture_output=True, text=True, timeout=5, creationflags=SPAWN_FLAGS
+            )
+        else:
+            # WSL - run nvidia-smi through Windows
+            result = subprocess.run(
+                ["nvidia-smi.exe",
+                 "--query-gpu=utilization.gpu,utilization.memory,temperature.gpu,power.draw,memory.used",
+                 "--format=csv,noheader,nounits"],
+                capture_output=True, text=True, timeout=5, creationflags=SPAWN_FLAGS
+            )
+
+        if result.returncode == 0:
+            parts = result.stdout.strip().split(",")
+            if len(parts) >= 5:
+                return HardwareMetrics(
+                    timestamp=datetime.now().isoformat(),
+                    gpu_util=float(parts[0].strip()),
+                    gpu_mem_util=float(parts[1].strip()),
+                    gpu_temp=float(parts[2].strip()),
+                    gpu_power=float(parts[3].strip()),
+                    gpu_mem_used=float(parts[4].strip())
+                )
+        return None
+
+    def _summary(self) -> Tuple[Optional[HardwareMetrics], Optional[HardwareMetrics]]:
+        if len(self.gpu_data) == self._window_start:
             return None, None
 
-        n = len(self.gpu_data)
-        avg = HardwareMetrics(
-            gpu_util=sum(m.gpu_util for m in self.gpu_data) / n,
-            gpu_mem_util=sum(m.gpu_mem_util for m in self.gpu_data) / n,
-            gpu_temp=sum(m.gpu_temp for m in self.gpu_data) / n,
-            gpu_power=sum(m.gpu_power for m in self.gpu_data) / n,
-            gpu_mem_used=sum(m.gpu_mem_used for m in self.gpu_data) / n,
-        )
-        max_m = HardwareMetrics(
-            gpu_util=max(m.gpu_util for m in self.gpu_data),
-            gpu_mem_util=max(m.gpu_mem_util for m in self.gpu_data),
-            gpu_temp=max(m.gpu_temp for m in self.gpu_data),
-            gpu_power=max(m.gpu_power for m in self.gpu_data),
-            gpu_mem_used=max(m.gpu_mem_used for m in self.gpu_data),
-        )
+        avg = HardwareMetrics(**{f: total / self._weight for f, total in zip(SUMMARY_FIELDS, self._sums)})
+        max_m = HardwareMetrics(**dict(zip(SUMMARY_FIELDS, self._maxes)))
         return avg, max_m
 
-    def save_metrics(self, filepath: Path):
-        """Save raw metrics to CSV."""
-        if not self.gpu_data:
+    def finish_test(self) -> Tuple[List[HardwareMetrics], List[float],
+                                   Optional[HardwareMetrics], Optional[HardwareMetrics]]:
+        """Close the current test's window; returns (samples, weights, avg, max)."""
+        with self._lock:
+            samples = self.gpu_data[self._window_start:]
+            weights = self.weights[self._window_start:]
+            avg, max_m = self._summary()
+        self.mark_test(None)
+        return samples, weights, avg, max_m
+
+    def save_metrics(self, filepath: Path, samples: List[HardwareMetrics]):
+        """Save raw metrics (a window from finish_test) to CSV."""
+        if not samples:
             return
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "gpu_util", "gpu_mem_util", "gpu_temp", "gpu_power", "gpu_mem_used", "process_gpu_util", "process_gpu_mem"])
-            for m in self.gpu_data:
-                writer.writerow([m.timestamp, m.gpu_util, m.gpu_mem_util, m.gpu_temp, m.gpu_power, m.gpu_mem_used, m.process_gpu_util, m.process_gpu_mem])
+        write_metrics_csv(filepath, samples)
 
 
 # ==============================================================================
@@ -424,12 +594,64 @@ class HardwareMonitor:
 class TestRunner:
     """Runs VanityMask tests with hardware monitoring."""
 
-    def __init__(self, exe_path: str, output_dir: Path, platform: str = "windows"):
+    def __init__(self, exe_path: str, output_dir: Path, platform: str = "windows",
+                 persistent: bool = False, early_exit: bool = False):
         self.exe_path = exe_path
         self.output_dir = output_dir
         self.platform = platform
+        self.persistent = persistent
+        # Stop sustained rate>X tests once the rate is proven (skips the
+        # sustained-load hardware data those tests exist to collect)
+        self.early_exit = early_exit
+        self.server: Optional[subprocess.Popen] = None
+        # One monitor spans run_all_tests; each GPU test marks its own window
+        self.monitor = HardwareMonitor(platform)
         self.results: List[TestResult] = []
         self.all_metrics: List[HardwareMetrics] = []
+        self.all_weights: List[float] = []
+
+    def _command(self, args: List[str]) -> Tuple[List[str], Optional[str]]:
+        """Return (cmd, cwd) running the binary with args on this platform."""
+        if self.platform == "windows":
+            return [self.exe_path] + args, str(self.output_dir.parent)
+        # WSL execution: --exec runs the binary directly, without a bash in between
+        return ["wsl", "--cd", WSL_WORKDIR, "--exec", self.exe_path] + args, None
+
+    def supports_server(self) -> bool:
+        """Older builds would take --server as a vanity prefix."""
+        cmd, cwd = self._command(["-h"])
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, cwd=cwd,
+                                    creationflags=SPAWN_FLAGS)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return SERVER_FLAG in result.stdout + result.stderr
+
+    def _uses_server(self, test_def: TestDefinition) -> bool:
+        # Utility/error tests exit the process, and sustained tests end in a kill
+        return self.persistent and test_def.exclusive and not test_def.sustained_load
+
+    def _server_process(self) -> subprocess.Popen:
+        """Return the running server, (re)starting it after a kill or crash."""
+        if self.server is not None and self.server.poll() is None:
+            return self.server
+        cmd, cwd = self._command([SERVER_FLAG])
+        self.server = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, text=True, bufsize=1, cwd=cwd,
+                                       creationflags=SPAWN_FLAGS)
+        return self.server
+
+    def stop_server(self):
+        """Close the server's stdin so it exits after the current job."""
+        if self.server is None:
+            return
+        if self.server.poll() is None:
+            try:
+                self.server.stdin.close()
+                self.server.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.server.kill()
+        self.server = None
 
     def run_test(self, test_def: TestDefinition) -> TestResult:
         """Run a single test with monitoring."""
@@ -446,8 +668,9 @@ class TestRunner:
             if output_file.exists():
                 output_file.unlink()
 
-        monitor = HardwareMonitor(self.platform)
-        monitor.start()
+        monitored = test_def.exclusive and self.monitor.running
+        if monitored:
+            self.monitor.mark_test(test_def.test_id)
 
         start_time = time.time()
         output = ""
@@ -455,50 +678,45 @@ class TestRunner:
         success = False
 
         try:
-            if self.platform == "windows":
-                cmd = [self.exe_path] + test_def.args
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=test_def.timeout,
-                    cwd=str(self.output_dir.parent)
-                )
+            completed = True
+            if self._uses_server(test_def):
+                output, timed_out, completed = self._run_on_server(test_def)
+                rate_proven = False
             else:
-                # WSL execution
-                wsl_cmd = f"cd /mnt/c/pirqjobs/vanitymask-workshop && {self.exe_path} " + " ".join(test_def.args)
-                result = subprocess.run(
-                    ["wsl", "bash", "-c", wsl_cmd],
-                    capture_output=True,
-                    text=True,
-                    timeout=test_def.timeout
-                )
-
-            output = result.stdout
-            error = result.stderr
+                cmd, cwd = self._command(test_def.args)
+                output, timed_out, rate_proven = self._stream_process(cmd, cwd, test_def)
             elapsed = time.time() - start_time
 
-            # Check pass criteria
-            success = self._check_criteria(output + error, test_def.pass_criteria)
+            if rate_proven:
+                success = True
+                output += f"\n[Stopped after {EARLY_EXIT_SAMPLES} samples above {test_def.pass_criteria}]"
+            elif timed_out:
+                elapsed = test_def.timeout
+                # For sustained load tests, timeout is success
+                success = test_def.sustained_load
+                output += f"\n[Timeout after {test_def.timeout}s - {'expected' if test_def.sustained_load else 'FAILED'}]"
+            elif not completed:
+                # The server died mid-job; don't judge the truncated output
+                success = False
+                output += f"\n[Server exited before {DONE_LINE} - FAILED]"
+            else:
+                # Check pass criteria
+                success = self._check_criteria(output, test_def.pass_criteria)
 
-        except subprocess.TimeoutExpired:
-            elapsed = test_def.timeout
-            # For sustained load tests, timeout is success
-            success = test_def.sustained_load
-            output = f"[Timeout after {test_def.timeout}s - {'expected' if test_def.sustained_load else 'FAILED'}]"
         except Exception as e:
             elapsed = time.time() - start_time
             error = str(e)
             success = False
 
-        monitor.stop()
+        avg_metrics = max_metrics = None
+        if monitored:
+            samples, weights, avg_metrics, max_metrics = self.monitor.finish_test()
 
-        # Save metrics for this test
-        metrics_path = self.output_dir / "metrics" / f"{test_def.test_id}_gpu.csv"
-        monitor.save_metrics(metrics_path)
-        self.all_metrics.extend(monitor.gpu_data)
-
-        avg_metrics, max_metrics = monitor.get_summary()
+            # Save metrics for this test
+            metrics_path = self.output_dir / "metrics" / f"{test_def.test_id}_gpu.csv"
+            self.monitor.save_metrics(metrics_path, samples)
+            self.all_metrics.extend(samples)
+            self.all_weights.extend(weights)
 
         # Extract throughput from output
         throughput = self._extract_throughput(output)
@@ -506,15 +724,17 @@ class TestRunner:
         # Save test log
         log_path = self.output_dir / "logs" / f"{test_def.test_id}.log"
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(log_path, 'w') as f:
-            f.write(f"Test: {test_def.test_id}\n")
-            f.write(f"Description: {test_def.description}\n")
-            f.write(f"Command: {test_def.args}\n")
-            f.write(f"Duration: {elapsed:.2f}s\n")
-            f.write(f"Success: {success}\n")
-            f.write(f"Throughput: {throughput}\n")
-            f.write(f"\n--- STDOUT ---\n{output}\n")
-            f.write(f"\n--- STDERR ---\n{error}\n")
+        # Passing tests only log the tail; failures keep everything captured
+        log_output = "\n".join(output.rsplit("\n", LOG_TAIL_LINES)[-LOG_TAIL_LINES:]) if success else output
+        log = (f"Test: {test_def.test_id}\n"
+               f"Description: {test_def.description}\n"
+               f"Command: {test_def.args}\n"
+               f"Duration: {elapsed:.2f}s\n"
+               f"Success: {success}\n"
+               f"Throughput: {throughput}\n"
+               f"\n--- STDOUT ---\n{log_output}\n"
+               f"\n--- STDERR ---\n{error}\n")
+        log_path.write_bytes(log.encode("utf-8", "replace"))
 
         result = TestResult(
             test_id=test_def.test_id,
@@ -533,45 +753,105 @@ class TestRunner:
 
         status = "PASS" if success else "FAIL"
         gpu_info = f"GPU:{avg_metrics.gpu_util:.0f}%" if avg_metrics else "GPU:N/A"
-        print(f"    [{status}] {elapsed:.1f}s | {throughput or 'N/A'} | {gpu_info}")
+        print(f"    [{status}] {test_def.test_id} {elapsed:.1f}s | {throughput or 'N/A'} | {gpu_info}")
 
         return result
 
+    def _stream_process(self, cmd: List[str], cwd: Optional[str],
+                        test_def: TestDefinition) -> Tuple[str, bool, bool]:
+        """Run cmd, tailing its merged output instead of buffering all of it.
+
+        Returns (last OUTPUT_TAIL_LINES lines, timed_out, rate_proven). With
+        early_exit, sustained rate>X tests are stopped as soon as
+        EARLY_EXIT_SAMPLES consecutive status lines beat the threshold;
+        otherwise they run to their timeout.
+        """
+        threshold = None
+        if self.early_exit and test_def.sustained_load and test_def.pass_criteria.startswith("rate>"):
+            threshold = float(test_def.pass_criteria[5:])
+
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        rate_proven = threading.Event()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1, cwd=cwd, creationflags=SPAWN_FLAGS)
+
+        def reader():
+            # Universal newlines split VanitySearch's \r status updates too
+            streak = 0
+            for line in proc.stdout:
+                tail.append(line.rstrip("\n"))
+                if threshold is None:
+                    continue
+                rate = self._extract_rate(line)
+                if rate is None:
+                    continue
+                streak = streak + 1 if rate > threshold else 0
+                if streak >= EARLY_EXIT_SAMPLES:
+                    rate_proven.set()
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+
+        deadline = time.time() + test_def.timeout
+        timed_out = False
+        while proc.poll() is None:
+            if rate_proven.wait(0.2):
+                proc.terminate()
+                break
+            if time.time() >= deadline:
+                timed_out = True
+                proc.kill()
+                break
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        # A grandchild (e.g. under wsl) can hold the pipe open; don't wait on it forever
+        reader_thread.join(timeout=5)
+
+        return "\n".join(tail), timed_out, rate_proven.is_set()
+
+    def _run_on_server(self, test_def: TestDefinition) -> Tuple[str, bool, bool]:
+        """Run one job on the persistent server.
+
+        Returns (output tail, timed_out, completed); completed is False when
+        the server's output ended without DONE_LINE (it died mid-job).
+        """
+        proc = self._server_process()
+        proc.stdin.write(" ".join(test_def.args) + "\n")
+        proc.stdin.flush()
+
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        done = threading.Event()
+
+        def reader():
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line == DONE_LINE:
+                    done.set()
+                    return
+                tail.append(line)
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+        reader_thread.join(timeout=test_def.timeout)
+        timed_out = reader_thread.is_alive()
+        if not done.is_set():
+            # Timed out (the job can't be cancelled) or died mid-job: reap it
+            # so the next test starts a fresh server
+            proc.kill()
+            proc.wait()
+            reader_thread.join(timeout=5)
+        return "\n".join(tail), timed_out, done.is_set()
+
     def _check_criteria(self, output: str, criteria: str) -> bool:
         """Check if output meets pass criteria."""
-        output_lower = output.lower()
-
-        if criteria == "found":
-            return "found" in output_lower or "priv" in output_lower or "address" in output_lower
-        elif criteria == "version_119":
-            # VanityMask is currently version 1.19
-            return "1.19" in output_lower or "1.20" in output_lower
-        elif criteria == "usage":
-            return "usage" in output_lower or "-gpu" in output_lower
-        elif criteria == "gpu":
-            return "gpu" in output_lower or "cuda" in output_lower or "4090" in output_lower
-        elif criteria == "ok":
-            return "ok" in output_lower or "check" in output_lower
-        elif criteria == "address":
-            # Looking for a Bitcoin address in output (starts with 1, 3, or bc1)
-            return "1" in output or "address" in output_lower
-        elif criteria == "priv":
-            return "priv" in output_lower
-        elif criteria == "pub":
-            return "pub" in output_lower or "04" in output or "02" in output or "03" in output
-        elif criteria == "mask_found":
-            # CPU mask mode should output MASK: prefix with matching X coordinate
-            return "mask:" in output_lower and "priv" in output_lower
-        elif criteria == "file_written":
-            # Check if the output file was written (find result)
-            return "found" in output_lower or "priv" in output_lower
-        elif criteria == "error_invalid":
-            # Should show error for invalid Base58 characters
-            return "invalid" in output_lower or "error" in output_lower or "argument" in output_lower
-        elif criteria == "error_missing":
-            # Should show error for missing required argument
-            return "error" in output_lower or "missing" in output_lower or "require" in output_lower or "target" in output_lower
-        elif criteria.startswith("rate>"):
+        groups = CRITERIA_NEEDLES.get(criteria)
+        if groups is not None:
+            output_lower = output.lower()
+            return all(any(needle in output_lower for needle in needles) for needles in groups)
+        if criteria.startswith("rate>"):
             # Check if throughput exceeds threshold
             threshold = float(criteria[5:])
             rate = self._extract_rate(output)
@@ -582,49 +862,66 @@ class TestRunner:
     def _extract_throughput(self, output: str) -> str:
         """Extract throughput string from output."""
         # Look for patterns like [27542.81 Mkey/s] or [GPU 26144.42 Mkey/s]
-        match = re.search(r'\[([\d.]+)\s*(M|G)?key/s\]', output, re.IGNORECASE)
+        match = RE_BRACKET_RATE.search(output)
         if match:
             return f"{match.group(1)} {match.group(2) or ''}Key/s"
 
-        match = re.search(r'([\d.]+)\s*(M|G)?key/s', output, re.IGNORECASE)
+        match = RE_BARE_RATE.search(output)
         if match:
             return f"{match.group(1)} {match.group(2) or ''}Key/s"
 
         return ""
 
     def _extract_rate(self, output: str) -> Optional[float]:
-        """Extract rate in GKey/s from output."""
-        # First try GKey/s
-        match = re.search(r'([\d.]+)\s*Gkey/s', output, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-
-        # Then try MKey/s and convert
-        match = re.search(r'([\d.]+)\s*Mkey/s', output, re.IGNORECASE)
-        if match:
-            return float(match.group(1)) / 1000
+        """Extract rate in GKey/s from the latest status line."""
+        windows = [output]
+        if len(output) > RATE_TAIL_CHARS:
+            # Start at a line boundary so no rate is cut in half
+            windows.insert(0, output[-RATE_TAIL_CHARS:].partition("\n")[2])
+
+        for text in windows:
+            match = last_match(RE_UNIT_RATE, text)
+            if match:
+                # Take that line's first field, [total][GPU ...], the same
+                # figure _extract_throughput reports
+                line_start = max(text.rfind("\n", 0, match.start()),
+                                 text.rfind("\r", 0, match.start())) + 1
+                match = RE_UNIT_RATE.search(text, line_start)
+                rate = float(match.group(1))
+                return rate if match.group(2).upper() == "G" else rate / 1000
 
         return None
 
     def run_all_tests(self, tests: List[TestDefinition]):
-        """Run all tests sequentially."""
+        """Run the non-exclusive tests concurrently, then the GPU tests one at a time."""
         print(f"\nRunning {len(tests)} tests on {self.platform}...")
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "logs").mkdir(exist_ok=True)
         (self.output_dir / "metrics").mkdir(exist_ok=True)
 
-        for test in tests:
-            self.run_test(test)
+        shared = [t for t in tests if not t.exclusive]
+        if shared:
+            with ThreadPoolExecutor(max_workers=len(shared)) as ex:
+                list(ex.map(self.run_test, shared))
+
+        self.monitor.start()
+        try:
+            for test in tests:
+                if test.exclusive:
+                    self.run_test(test)
+        finally:
+            self.monitor.stop()
+            self.stop_server()
+
+        # Report in definition order regardless of completion order
+        order = {t.test_id: i for i, t in enumerate(tests)}
+        self.results.sort(key=lambda r: order[r.test_id])
 
         # Save combined metrics
         if self.all_metrics:
             combined_path = self.output_dir / "metrics" / "combined_gpu.csv"
-            with open(combined_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "gpu_util", "gpu_mem_util", "gpu_temp", "gpu_power", "gpu_mem_used", "process_gpu_util", "process_gpu_mem"])
-                for m in self.all_metrics:
-                    writer.writerow([m.timestamp, m.gpu_util, m.gpu_mem_util, m.gpu_temp, m.gpu_power, m.gpu_mem_used, m.process_gpu_util, m.process_gpu_mem])
+            write_metrics_csv(combined_path, self.all_metrics)
 
     def generate_report(self) -> str:
         """Generate markdown report."""
@@ -632,18 +929,20 @@ class TestRunner:
         failed = len(self.results) - passed
         total_duration = sum(r.duration for r in self.results)
 
-        # Calculate overall metrics
+        # Calculate overall metrics, time-weighted like the per-test averages
         if self.all_metrics:
-            avg_gpu = sum(m.gpu_util for m in self.all_metrics) / len(self.all_metrics)
+            total_weight = sum(self.all_weights)
+            pairs = list(zip(self.all_metrics, self.all_weights))
+            avg_gpu = sum(m.gpu_util * w for m, w in pairs) / total_weight
             max_gpu = max(m.gpu_util for m in self.all_metrics)
-            avg_temp = sum(m.gpu_temp for m in self.all_metrics) / len(self.all_metrics)
+            avg_temp = sum(m.gpu_temp * w for m, w in pairs) / total_weight
             max_temp = max(m.gpu_temp for m in self.all_metrics)
-            avg_power = sum(m.gpu_power for m in self.all_metrics) / len(self.all_metrics)
+            avg_power = sum(m.gpu_power * w for m, w in pairs) / total_weight
             max_power = max(m.gpu_power for m in self.all_metrics)
         else:
             avg_gpu = max_gpu = avg_temp = max_temp = avg_power = max_power = 0
 
-        report = f"""# VanityMask Test Report - {self.platform.upper()}
+        parts = [f"""# VanityMask Test Report - {self.platform.upper()}
 
 **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Platform**: {self.platform}
@@ -671,21 +970,23 @@ class TestRunner:
 
 | Test ID | Description | Duration | GPU% | Throughput | Result |
 |---------|-------------|----------|------|------------|--------|
-"""
+"""]
 
         for r in self.results:
             status = "PASS" if r.success else "FAIL"
             gpu_pct = f"{r.metrics_avg.gpu_util:.0f}%" if r.metrics_avg else "N/A"
-            report += f"| {r.test_id} | {r.description} | {r.duration:.1f}s | {gpu_pct} | {r.throughput or 'N/A'} | {status} |\n"
+            parts.append(f"| {r.test_id} | {r.description} | {r.duration:.1f}s | {gpu_pct} | {r.throughput or 'N/A'} | {status} |\n")
 
         # Add failed test details
         failed_tests = [r for r in self.results if not r.success]
         if failed_tests:
-            report += "\n## Failed Test Details\n\n"
+            parts.append("\n## Failed Test Details\n\n")
             for r in failed_tests:
-                report += f"### {r.test_id}: {r.description}\n\n"
-                report += f"**Command**: `{' '.join(r.command)}`\n\n"
-                report += f"**Error**:\n```\n{r.error[:500] if r.error else 'No error output'}\n```\n\n"
+                parts.append(f"### {r.test_id}: {r.description}\n\n"
+                             f"**Command**: `{' '.join(r.command)}`\n\n"
+                             f"**Error**:\n```\n{r.error[:500] if r.error else 'No error output'}\n```\n\n")
+
+        report = "".join(parts)
 
         # Save report
         report_path = self.output_dir / "report.md"
@@ -781,6 +1082,10 @@ def main():
     parser.add_argument("--windows-only", action="store_true", help="Run only Windows tests")
     parser.add_argument("--wsl-only", action="store_true", help="Run only WSL tests")
     parser.add_argument("--quick", action="store_true", help="Quick mode with reduced durations")
+    parser.add_argument("--persistent", action="store_true",
+                        help="Run search tests in one VanitySearch --server process (CUDA init paid once)")
+    parser.add_argument("--fast", action="store_true",
+                        help="End sustained rate tests once the rate is proven (no sustained-load data)")
     args = parser.parse_args()
 
     # Create timestamped output directory
@@ -808,8 +1113,13 @@ def main():
         runner = TestRunner(
             exe_path=WINDOWS_EXE,
             output_dir=output_dir / "windows",
-            platform="windows"
+            platform="windows",
+            early_exit=args.fast
         )
+        if args.persistent:
+            runner.persistent = runner.supports_server()
+            if not runner.persistent:
+                print("WARNING: VanitySearch build lacks --server - spawning per test")
         runner.run_all_tests(tests)
         runner.generate_report()
         windows_results = runner.results
@@ -828,8 +1138,13 @@ def main():
         runner = TestRunner(
             exe_path=WSL_EXE,
             output_dir=output_dir / "wsl",
-            platform="wsl"
+            platform="wsl",
+            early_exit=args.fast
         )
+        if args.persistent:
+            runner.persistent = runner.supports_server()
+            if not runner.persistent:
+                print("WARNING: VanitySearch build lacks --server - spawning per test")
         runner.run_all_tests(wsl_tests)
         runner.generate_report()
         wsl_results = runner.results